@@ -1,5 +1,6 @@
 """OSM OAuth2 authentication for FastAPI."""
 
+import copy
 from datetime import UTC, datetime, timedelta
 from secrets import token_urlsafe
 from typing import Any, Optional
@@ -8,10 +9,13 @@ import httpx
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from . import config
-from .db import User, get_db
+from .cache import TTLCache
+from .db import User, get_async_db
 
 # OAuth and JWT configuration from centralized config
 OSM_CLIENT_ID = config.OSM_CLIENT_ID
@@ -32,6 +36,14 @@ OSM_USER_URL = f"{OSM_BASE_URL}/api/0.6/user/details.json"
 
 security = HTTPBearer()
 
+# Column snapshots of recently authenticated users, keyed by OSM user id (the
+# JWT subject) so writers can invalidate them. Tokens are still verified on
+# every request; only the users-table lookup is skipped. Disabled unless
+# USER_CACHE_TTL_SECONDS is set.
+_user_cache = TTLCache(maxsize=10_000, ttl=config.USER_CACHE_TTL_SECONDS)
+# Credentials are never kept in the cache; see get_osm_access_token
+_UNCACHED_USER_COLUMNS = frozenset({"osm_access_token"})
+
 
 class OSMAuth:
     """Handle OSM OAuth2 authentication."""
@@ -167,7 +179,7 @@ def verify_token(token: str) -> Optional[dict]:
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Get current authenticated user."""
     credentials_exception = HTTPException(
@@ -185,14 +197,54 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        return await _attach_cached_user(db, cached)
+
     # Get user from database
-    user = db.query(User).filter(User.osm_user_id == user_id).first()
+    result = await db.execute(select(User).where(User.osm_user_id == user_id))
+    user = result.scalar_one_or_none()
+    # End the lookup's transaction so the pooled connection goes back to the
+    # pool instead of sitting idle in transaction for the rest of the request
+    # (e.g. while a handler waits on the OSM API). The session does not expire
+    # on commit, so the loaded user stays usable.
+    await db.commit()
     if user is None:
         raise credentials_exception
 
+    _user_cache.set(user_id, _snapshot_user(user))
     return user
 
 
+def invalidate_cached_user(osm_user_id: str) -> None:
+    """Drop a user from the auth cache after their row has changed."""
+    _user_cache.pop(osm_user_id)
+
+
+def get_osm_access_token(db: Session, user: User) -> Optional[str]:
+    """Read the user's OSM OAuth token from the database.
+
+    The token is left out of cached users, so endpoints that call the OSM API
+    fetch it from the row instead of reading it off current_user.
+    """
+    return db.scalar(select(User.osm_access_token).where(User.id == user.id))
+
+
+def _snapshot_user(user: User) -> dict[str, Any]:
+    return {
+        attr.key: copy.deepcopy(getattr(user, attr.key))
+        for attr in inspect(User).column_attrs
+        if attr.key not in _UNCACHED_USER_COLUMNS
+    }
+
+
+async def _attach_cached_user(db: AsyncSession, snapshot: dict[str, Any]) -> User:
+    """Rebuild a cached user and attach it to the session without a SELECT."""
+    user = User(**copy.deepcopy(snapshot))
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
 def create_or_update_user(
     db: Session, osm_user_data: dict, osm_access_token: str = None
 ) -> User:
@@ -228,4 +280,5 @@ def create_or_update_user(
 
     db.commit()
     db.refresh(user)
+    invalidate_cached_user(osm_user_id)
     return user
@@ -97,6 +97,12 @@ JWT_ALGORITHM = get_env("JWT_ALGORITHM", "HS256")
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(
     get_env("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "1440")
 )
+# How long an authenticated user row is reused without a DB lookup. Off by
+# default: invalidation only reaches the worker that made the change, so other
+# workers can serve stale settings or a deleted user for up to this long.
+USER_CACHE_TTL_SECONDS = float(get_env("USER_CACHE_TTL_SECONDS", "0"))
+# How long the /places/classes/list counts are reused (0 disables)
+CLASSES_CACHE_TTL_SECONDS = float(get_env("CLASSES_CACHE_TTL_SECONDS", "600"))
 
 # OpenStreetMap OAuth
 # NOTE: These require real values in .env.local for OAuth to work
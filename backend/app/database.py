@@ -1,25 +1,54 @@
 """Database configuration and shared models for the FourMore backend."""
 
+import asyncio
 import time
 import logging
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from .database_models import Base, POI, User, CheckIn, QuestResponse
+from .database_models import (
+    Base,
+    POI,
+    User,
+    CheckIn,
+    QuestResponse,
+    poi_searchable,
+)
 from . import config
 
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = config.DATABASE_URL
 
+# A larger compiled-statement cache keeps the per-endpoint select() constructs
+# from being recompiled once the default 500-entry LRU starts evicting.
 engine = create_engine(
     DATABASE_URL,
+    query_cache_size=1200,
     pool_pre_ping=True,
     pool_recycle=300,
     connect_args={"connect_timeout": 10},
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# asyncpg engine for the read-heavy places endpoints, so waiting on PostGIS
+# does not hold a threadpool worker. Kept small: it shares the server's
+# max_connections (50) with the sync pool across all app workers.
+async_engine = create_async_engine(
+    make_url(DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_size=5,
+    max_overflow=5,
+    query_cache_size=1200,
+    pool_pre_ping=True,
+    pool_recycle=300,
+    connect_args={"timeout": 10},
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def create_tables():
     """Create all tables with retry logic for database connection."""
@@ -45,6 +74,27 @@ def create_tables():
                 raise
 
 
+async def warm_async_pool():
+    """Open the async pool's base connections at startup.
+
+    Connects in parallel so the first requests of a worker don't each pay the
+    connect and auth handshake. Failures are only logged; the pool still
+    connects lazily.
+    """
+    results = await asyncio.gather(
+        *(async_engine.connect() for _ in range(async_engine.pool.size())),
+        return_exceptions=True,
+    )
+    connections = [conn for conn in results if not isinstance(conn, BaseException)]
+    for conn in connections:
+        await conn.close()
+    if len(connections) < len(results):
+        errors = [exc for exc in results if isinstance(exc, BaseException)]
+        logger.warning("Could not pre-open all pool connections: %s", errors[0])
+    else:
+        logger.debug("Pre-opened %d async pool connections", len(connections))
+
+
 def get_db():
     """Get database session."""
     db = SessionLocal()
@@ -52,3 +102,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Get async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -6,20 +6,26 @@ from sqlalchemy import (
     BigInteger,
     String,
     DateTime,
+    ForeignKey,
     Text,
     Boolean,
     Index,
+    MetaData,
+    Table,
     UniqueConstraint,
     text,
 )
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import JSONB
-from geoalchemy2 import Geometry
+from geoalchemy2 import Geography, Geometry
 from geoalchemy2.shape import to_shape
 
 Base = declarative_base()
 
+# Tags joined, in this order, into POI.address
+ADDRESS_KEYS = ("addr:housenumber", "addr:street", "addr:city", "addr:postcode")
+
 
 class POI(Base):
     """Point of Interest model matching osm2pgsql schema."""
@@ -57,11 +63,8 @@ class POI(Base):
         if not self.tags:
             return None
 
-        addr_parts = []
-        for key in ["addr:housenumber", "addr:street", "addr:city", "addr:postcode"]:
-            if key in self.tags:
-                addr_parts.append(self.tags[key])
-
+        tags = self.tags
+        addr_parts = [tags[key] for key in ADDRESS_KEYS if key in tags]
         return ", ".join(addr_parts) if addr_parts else None
 
     @property
@@ -80,13 +83,43 @@ class POI(Base):
         return self.tags.get("opening_hours") if self.tags else None
 
     def _to_point(self):
-        """Convert the geometry to a shapely point, if possible."""
-        if self.geom is None:
-            return None
-        try:
-            return to_shape(self.geom)
-        except Exception:
-            return None
+        """Convert the geometry to a shapely point, if possible.
+
+        The result is kept on the instance for as long as geom is the same
+        object, so reading lat and lon parses the WKB once.
+        """
+        geom = self.geom
+        cached = getattr(self, "_point_cache", None)
+        if cached is not None and cached[0] is geom:
+            return cached[1]
+
+        point = None
+        if geom is not None:
+            try:
+                point = to_shape(geom)
+            except Exception:
+                point = None
+        self._point_cache = (geom, point)
+        return point
+
+
+# Read-only materialized view built by the data pipeline
+# (data-pipeline/poi_searchable.sql): POIs the list endpoints may return, with
+# the geography cast precomputed. Kept off Base.metadata so create_all never
+# creates it as a table.
+poi_searchable = Table(
+    "poi_searchable",
+    MetaData(),
+    Column("osm_type", String(1), primary_key=True),
+    Column("osm_id", BigInteger, primary_key=True),
+    Column("name", Text),
+    Column("class", Text, key="poi_class"),
+    Column("tags", JSONB),
+    Column("geom", Geometry("POINT", srid=4326)),
+    Column("geog", Geography("POINT", srid=4326)),
+    Column("version", Integer),
+    Column("timestamp", DateTime),
+)
 
 
 class User(Base):
@@ -114,7 +147,11 @@ class CheckIn(Base):
     __tablename__ = "checkins"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False, index=True)
+    # Deleting a user removes their check-ins in the database. Lookups by
+    # user_id use idx_checkins_user_created below, so no single-column index.
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
 
     # Reference POI by composite key
     poi_osm_type = Column(String(1), nullable=False, index=True)
@@ -127,6 +164,10 @@ class CheckIn(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
+    # Serves the "latest check-in of this user" lookup joined into the place
+    # list queries with a single index probe
+    __table_args__ = (Index("idx_checkins_user_created", "user_id", created_at.desc()),)
+
 
 class QuestResponse(Base):
     """Quest response model - tracks completed quests globally."""
@@ -1,21 +1,21 @@
-"""Database configuration for FastAPI backend."""
+"""Database configuration for FastAPI backend.
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from . import config
+Kept as a thin alias of ``app.database`` so routers and the app share a
+single engine and connection pool.
+"""
 
-# Import models from local database module (copied from data-pipeline)
-from .database import Base, POI, User, CheckIn, QuestResponse
-
-DATABASE_URL = config.DATABASE_URL
-
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-def get_db():
-    """Dependency to get database session."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+from .database import (
+    DATABASE_URL,
+    Base,
+    CheckIn,
+    POI,
+    QuestResponse,
+    AsyncSessionLocal,
+    SessionLocal,
+    User,
+    async_engine,
+    engine,
+    get_async_db,
+    get_db,
+    poi_searchable,
+)
@@ -35,7 +35,8 @@ logger.warning("Starting FourMore FastAPI application WARNING")
 
 # Import routers
 from .routers import auth, places, checkins, osm_edits, categories, quests, users
-from .database import create_tables
+from .database import async_engine, create_tables, warm_async_pool
+from .osm_api import create_http_client
 
 
 @asynccontextmanager
@@ -46,11 +47,15 @@ async def lifespan(app: FastAPI):
     logger.info("Creating database tables...")
     create_tables()
     logger.info("Database tables created successfully")
+    app.state.http = create_http_client()
+    await warm_async_pool()
 
     yield
 
-    # Shutdown (if needed)
+    # Shutdown
     logger.info("Application shutting down...")
+    await app.state.http.aclose()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -71,6 +76,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
@@ -1,7 +1,7 @@
 """Pydantic models for API requests and responses."""
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from fastapi import Path
 from pydantic import BaseModel, Field, field_validator, field_serializer
 from sqlalchemy import Column
@@ -24,6 +24,15 @@ def NormalizeOsmType(
     return osm_type_validator_to_short(osm_type)
 
 
+# Class filters accept one class or a list; endpoints always get a list (or None)
+def normalize_class_filter(
+    value: Optional[Union[str, List[str]]],
+) -> Optional[List[str]]:
+    if isinstance(value, str):
+        value = [value]
+    return value or None
+
+
 # POI Models
 class POIBase(BaseModel):
     name: Optional[str] = None
@@ -72,12 +81,26 @@ class POIResponse(POIBase):
 class POINearbyRequest(BaseModel):
     lat: float = Field(..., ge=-90, le=90, description="Latitude")
     lon: float = Field(..., ge=-180, le=180, description="Longitude")
-    radius: float = Field(1000, ge=1, le=10000, description="Search radius in meters")
-    poi_class: Optional[str] = Field(
-        None, alias="class", description="Filter by POI class"
+    radius: float = Field(
+        1000,
+        ge=0,
+        le=10000,
+        description="Search radius in meters (0 matches POIs at the exact location)",
+    )
+    poi_class: Optional[Union[str, List[str]]] = Field(
+        None, alias="class", description="Filter by POI class or list of classes"
     )
     limit: int = Field(20, ge=1, le=100, description="Maximum number of results")
     offset: int = Field(0, ge=0, description="Number of results to skip for pagination")
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page",
+    )
+
+    @field_validator("poi_class")
+    @classmethod
+    def normalize_poi_class(cls, v):
+        return normalize_class_filter(v)
 
 
 class POISearchRequest(BaseModel):
@@ -96,6 +119,10 @@ class POISearchRequest(BaseModel):
     )
     limit: int = Field(20, ge=1, le=50, description="Maximum number of results")
     offset: int = Field(0, ge=0, description="Number of results to skip for pagination")
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page",
+    )
 
     @field_validator("query")
     @classmethod
@@ -111,11 +138,20 @@ class POIBboxRequest(BaseModel):
     south: float = Field(..., ge=-90, le=90, description="Southern latitude bound")
     east: float = Field(..., ge=-180, le=180, description="Eastern longitude bound")
     west: float = Field(..., ge=-180, le=180, description="Western longitude bound")
-    poi_class: Optional[str] = Field(
-        None, alias="class", description="Filter by POI class"
+    poi_class: Optional[Union[str, List[str]]] = Field(
+        None, alias="class", description="Filter by POI class or list of classes"
     )
     limit: int = Field(20, ge=1, le=100, description="Maximum number of results")
     offset: int = Field(0, ge=0, description="Number of results to skip for pagination")
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page",
+    )
+
+    @field_validator("poi_class")
+    @classmethod
+    def normalize_poi_class(cls, v):
+        return normalize_class_filter(v)
 
     @field_validator("north", "south")
     @classmethod
@@ -4,7 +4,7 @@ import logging
 import httpx
 from datetime import datetime
 from typing import Dict, Any
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, status
 import xml.etree.ElementTree as ET
 
 from .models import POIResponse, osm_type_validator_to_full
@@ -16,6 +16,20 @@ OSM_API_BASE = "https://api.openstreetmap.org/api/0.6"
 MAX_LOG_SNIPPET = 800
 
 
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP/2 client shared by all OSM API calls."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=10,
+    )
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Dependency returning the HTTP client created during app startup."""
+    return request.app.state.http
+
+
 def _log_snippet(payload: str, limit: int = MAX_LOG_SNIPPET) -> str:
     """Return a log-safe snippet of payload content."""
     if payload is None:
@@ -39,9 +53,10 @@ def _serialize_osm_element(element: ET.Element) -> str:
 class OSMAPIClient:
     """Client for OSM API editing operations."""
 
-    def __init__(self, access_token: str):
-        """Initialize with user's OSM access token."""
+    def __init__(self, access_token: str, http_client: httpx.AsyncClient):
+        """Initialize with user's OSM access token and a shared HTTP client."""
         self.access_token = access_token
+        self.http_client = http_client
         self.headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "text/xml",
@@ -59,50 +74,49 @@ class OSMAPIClient:
             )
 
         url = f"{OSM_API_BASE}/{osm_type}/{osm_id}"
-        async with httpx.AsyncClient() as client:
-            logger.debug("OSM request: GET %s", url)
-            response = await client.get(
-                url, headers={"Authorization": f"Bearer {self.access_token}"}
-            )
-            logger.debug(
-                "OSM response: GET %s -> status=%s body=%s",
-                url,
-                response.status_code,
-                _log_snippet(response.text),
-            )
+        logger.debug("OSM request: GET %s", url)
+        response = await self.http_client.get(
+            url, headers={"Authorization": f"Bearer {self.access_token}"}
+        )
+        logger.debug(
+            "OSM response: GET %s -> status=%s body=%s",
+            url,
+            response.status_code,
+            _log_snippet(response.text),
+        )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"{osm_type.capitalize()} {osm_id} not found on OSM",
-                )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{osm_type.capitalize()} {osm_id} not found on OSM",
+            )
 
-            root = ET.fromstring(response.text)
-            element = root.find(osm_type)
+        root = ET.fromstring(response.text)
+        element = root.find(osm_type)
 
-            if element is None:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Invalid {osm_type} data",
-                )
+        if element is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Invalid {osm_type} data",
+            )
 
-            tags = {tag.get("k"): tag.get("v") for tag in element.findall("tag")}
+        tags = {tag.get("k"): tag.get("v") for tag in element.findall("tag")}
 
-            result = {
-                "id": element.get("id"),
-                "version": int(element.get("version")),
-                "changeset": element.get("changeset"),
-                "tags": tags,
-                "type": osm_type,
-            }
+        result = {
+            "id": element.get("id"),
+            "version": int(element.get("version")),
+            "changeset": element.get("changeset"),
+            "tags": tags,
+            "type": osm_type,
+        }
 
-            if osm_type == "node":
-                result["lat"] = float(element.get("lat"))
-                result["lon"] = float(element.get("lon"))
-            elif osm_type == "way":
-                result["nodes"] = [nd.get("ref") for nd in element.findall("nd")]
+        if osm_type == "node":
+            result["lat"] = float(element.get("lat"))
+            result["lon"] = float(element.get("lon"))
+        elif osm_type == "way":
+            result["nodes"] = [nd.get("ref") for nd in element.findall("nd")]
 
-            return result
+        return result
 
     async def create_changeset(self, comment: str, created_by: str = "FourMore") -> str:
         """Create a new changeset."""
@@ -115,27 +129,24 @@ class OSMAPIClient:
         _log_snippet(changeset_xml)
 
         url = f"{OSM_API_BASE}/changeset/create"
-        async with httpx.AsyncClient() as client:
-            logger.debug(
-                "OSM request: PUT %s body=%s", url, _log_snippet(changeset_xml)
-            )
-            response = await client.put(
-                url, headers=self.headers, content=changeset_xml
-            )
-            logger.debug(
-                "OSM response: PUT %s -> status=%s body=%s",
-                url,
-                response.status_code,
-                _log_snippet(response.text),
-            )
+        logger.debug("OSM request: PUT %s body=%s", url, _log_snippet(changeset_xml))
+        response = await self.http_client.put(
+            url, headers=self.headers, content=changeset_xml
+        )
+        logger.debug(
+            "OSM response: PUT %s -> status=%s body=%s",
+            url,
+            response.status_code,
+            _log_snippet(response.text),
+        )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Failed to create changeset: {response.text}",
-                )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to create changeset: {response.text}",
+            )
 
-            return response.text.strip()
+        return response.text.strip()
 
     async def update_node(
         self,
@@ -165,23 +176,24 @@ class OSMAPIClient:
         node_xml = _serialize_osm_element(root)
 
         url = f"{OSM_API_BASE}/node/{node_id}"
-        async with httpx.AsyncClient() as client:
-            logger.debug("OSM request: PUT %s body=%s", url, _log_snippet(node_xml))
-            response = await client.put(url, headers=self.headers, content=node_xml)
-            logger.debug(
-                "OSM response: PUT %s -> status=%s body=%s",
-                url,
-                response.status_code,
-                _log_snippet(response.text),
-            )
+        logger.debug("OSM request: PUT %s body=%s", url, _log_snippet(node_xml))
+        response = await self.http_client.put(
+            url, headers=self.headers, content=node_xml
+        )
+        logger.debug(
+            "OSM response: PUT %s -> status=%s body=%s",
+            url,
+            response.status_code,
+            _log_snippet(response.text),
+        )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Failed to update node: {response.text}",
-                )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to update node: {response.text}",
+            )
 
-            return int(response.text.strip())
+        return int(response.text.strip())
 
     async def update_way(
         self,
@@ -210,44 +222,44 @@ class OSMAPIClient:
         way_xml = _serialize_osm_element(root)
 
         url = f"{OSM_API_BASE}/way/{way_id}"
-        async with httpx.AsyncClient() as client:
-            logger.debug("OSM request: PUT %s body=%s", url, _log_snippet(way_xml))
-            response = await client.put(url, headers=self.headers, content=way_xml)
-            logger.debug(
-                "OSM response: PUT %s -> status=%s body=%s",
-                url,
-                response.status_code,
-                _log_snippet(response.text),
-            )
+        logger.debug("OSM request: PUT %s body=%s", url, _log_snippet(way_xml))
+        response = await self.http_client.put(
+            url, headers=self.headers, content=way_xml
+        )
+        logger.debug(
+            "OSM response: PUT %s -> status=%s body=%s",
+            url,
+            response.status_code,
+            _log_snippet(response.text),
+        )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Failed to update way: {response.text}",
-                )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to update way: {response.text}",
+            )
 
-            return int(response.text.strip())
+        return int(response.text.strip())
 
     async def close_changeset(self, changeset_id: str):
         """Close a changeset."""
         url = f"{OSM_API_BASE}/changeset/{changeset_id}/close"
-        async with httpx.AsyncClient() as client:
-            logger.debug("OSM request: PUT %s", url)
-            response = await client.put(
-                url, headers={"Authorization": f"Bearer {self.access_token}"}
-            )
-            logger.debug(
-                "OSM response: PUT %s -> status=%s body=%s",
-                url,
-                response.status_code,
-                _log_snippet(response.text),
-            )
+        logger.debug("OSM request: PUT %s", url)
+        response = await self.http_client.put(
+            url, headers={"Authorization": f"Bearer {self.access_token}"}
+        )
+        logger.debug(
+            "OSM response: PUT %s -> status=%s body=%s",
+            url,
+            response.status_code,
+            _log_snippet(response.text),
+        )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Failed to close changeset: {response.text}",
-                )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to close changeset: {response.text}",
+            )
 
     async def update_element_tags(
         self, poi: POIResponse, new_tags: Dict[str, str], changeset_comment: str
@@ -264,7 +276,7 @@ class OSMAPIClient:
             Dict with osm_id, osm_type, new_version, changeset_id, and updated tags
         """
         element_data = await self.get_element(poi.osm_id, poi.osm_type)
-        logger.debug(f"Retrieved OSM element data: {element_data}")
+        logger.debug("Retrieved OSM element data: %s", element_data)
 
         tags = element_data["tags"].copy()
         tags.update(new_tags)
@@ -292,7 +304,9 @@ class OSMAPIClient:
                     changeset_id=changeset_id,
                 )
 
-            logger.info(f"Updated {poi.osm_type} {poi.osm_id} to version {new_version}")
+            logger.info(
+                "Updated %s %s to version %s", poi.osm_type, poi.osm_id, new_version
+            )
 
             await self.close_changeset(changeset_id)
 
@@ -327,33 +341,34 @@ class OSMAPIClient:
         # OSM Notes API expects form data, not URL params
         data = {"lat": str(lat), "lon": str(lon), "text": text}
 
-        async with httpx.AsyncClient() as client:
-            logger.debug(f"Creating OSM note with data: {data}")
-            response = await client.post(
-                f"{OSM_API_BASE}/notes",
-                headers={"Authorization": f"Bearer {self.access_token}"},
-                data=data,  # Use data instead of params
-            )
-
-            logger.debug(
-                f"OSM API response: status={response.status_code}, content={response.text[:500]}"
-            )
-
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Failed to create note: {response.text}",
-                )
+        logger.debug("Creating OSM note with data: %s", data)
+        response = await self.http_client.post(
+            f"{OSM_API_BASE}/notes",
+            headers={"Authorization": f"Bearer {self.access_token}"},
+            data=data,  # Use data instead of params
+        )
 
-            # The response is XML, we need to parse it to get the note id
-            root = ET.fromstring(response.text)
-            note_element = root.find("note")
-            if note_element is not None:
-                note_id_element = note_element.find("id")
-                if note_id_element is not None and note_id_element.text:
-                    return int(note_id_element.text)
+        logger.debug(
+            "OSM API response: status=%s, content=%s",
+            response.status_code,
+            _log_snippet(response.text),
+        )
 
+        if response.status_code != 200:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to parse note creation response: {response.text}",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to create note: {response.text}",
             )
+
+        # The response is XML, we need to parse it to get the note id
+        root = ET.fromstring(response.text)
+        note_element = root.find("note")
+        if note_element is not None:
+            note_id_element = note_element.find("id")
+            if note_id_element is not None and note_id_element.text:
+                return int(note_id_element.text)
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to parse note creation response: {response.text}",
+        )
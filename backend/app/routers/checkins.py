@@ -7,8 +7,8 @@ import csv
 import json
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import desc, func, select
 from ..db import get_db, CheckIn, POI, User
 from ..auth import get_current_user
 from ..models import CheckInCreate, CheckInUpdate, CheckInResponse, CheckInListResponse, POIResponse, APIResponse
@@ -16,17 +16,19 @@ from ..models import CheckInCreate, CheckInUpdate, CheckInResponse, CheckInListR
 router = APIRouter(prefix="/checkins", tags=["checkins"])
 
 @router.post("", response_model=CheckInResponse)
-async def create_checkin(
+def create_checkin(
     checkin_data: CheckInCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new check-in."""
-    # Verify POI exists
-    poi = db.query(POI).filter(
-        POI.osm_type == checkin_data.poi_osm_type,
-        POI.osm_id == checkin_data.poi_osm_id
-    ).first()
+    # Verify POI exists (key columns only; details are loaded for the response)
+    poi = db.execute(
+        select(POI).options(load_only(POI.osm_type, POI.osm_id)).where(
+            POI.osm_type == checkin_data.poi_osm_type,
+            POI.osm_id == checkin_data.poi_osm_id
+        )
+    ).scalar_one_or_none()
     if not poi:
         raise HTTPException(status_code=404, detail="Place not found")
 
@@ -52,7 +54,7 @@ async def create_checkin(
     return get_checkin_with_poi(db, checkin)
 
 @router.get("", response_model=CheckInListResponse)
-async def get_user_checkins(
+def get_user_checkins(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
@@ -89,7 +91,7 @@ async def get_user_checkins(
     )
 
 @router.get("/{checkin_id}", response_model=CheckInResponse)
-async def get_checkin_details(
+def get_checkin_details(
     checkin_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -106,7 +108,7 @@ async def get_checkin_details(
     return get_checkin_with_poi(db, checkin)
 
 @router.patch("/{checkin_id}", response_model=CheckInResponse)
-async def update_checkin(
+def update_checkin(
     checkin_id: int,
     update_data: CheckInUpdate,
     db: Session = Depends(get_db),
@@ -130,7 +132,7 @@ async def update_checkin(
     return get_checkin_with_poi(db, checkin)
 
 @router.delete("/{checkin_id}")
-async def delete_checkin(
+def delete_checkin(
     checkin_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -153,7 +155,7 @@ async def delete_checkin(
     )
 
 @router.get("/stats/summary")
-async def get_checkin_stats(
+def get_checkin_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -194,13 +196,20 @@ async def get_checkin_stats(
     )
 
 @router.get("/export/geojson")
-async def export_checkins_geojson(
+def export_checkins_geojson(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Export all user checkins as GeoJSON."""
-    # Get all checkins with POI details
-    checkins = db.query(CheckIn, POI).join(
+    # Get all checkins with the POI columns the export uses (skip tags JSONB);
+    # PostGIS extracts the coordinates so no WKB is parsed per row here
+    checkins = db.query(
+        CheckIn,
+        POI.name,
+        POI.poi_class,
+        func.ST_X(POI.geom).label('lon'),
+        func.ST_Y(POI.geom).label('lat'),
+    ).join(
         POI,
         (CheckIn.poi_osm_type == POI.osm_type) & (CheckIn.poi_osm_id == POI.osm_id)
     ).filter(
@@ -209,21 +218,21 @@ async def export_checkins_geojson(
 
     # Build GeoJSON FeatureCollection
     features = []
-    for checkin, poi in checkins:
+    for checkin, name, poi_class, lon, lat in checkins:
         osm_type_full = {"N": "node", "W": "way"}.get(checkin.poi_osm_type, checkin.poi_osm_type)
 
         feature = {
             "type": "Feature",
             "geometry": {
                 "type": "Point",
-                "coordinates": [poi.lon, poi.lat]
+                "coordinates": [lon, lat]
             },
             "properties": {
                 "datetime": checkin.created_at.isoformat(),
                 "osm_type": osm_type_full,
                 "osm_id": checkin.poi_osm_id,
-                "name": poi.name or '',
-                "class": poi.poi_class,
+                "name": name or '',
+                "class": poi_class,
                 "comment": checkin.comment or ''
             }
         }
@@ -246,10 +255,12 @@ async def export_checkins_geojson(
 
 def get_checkin_with_poi(db: Session, checkin: CheckIn) -> CheckInResponse:
     """Helper function to get checkin with POI details."""
-    poi = db.query(POI).filter(
-        POI.osm_type == checkin.poi_osm_type,
-        POI.osm_id == checkin.poi_osm_id
-    ).first()
+    poi = db.execute(
+        select(POI).where(
+            POI.osm_type == checkin.poi_osm_type,
+            POI.osm_id == checkin.poi_osm_id
+        )
+    ).scalar_one_or_none()
 
     if not poi:
         raise HTTPException(status_code=404, detail="Associated place not found")
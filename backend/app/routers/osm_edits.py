@@ -1,15 +1,18 @@
 """OSM editing endpoints."""
 
 import logging
+
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import Text, cast, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from pydantic import BaseModel, field_validator
 
 from ..models import POIResponse, osm_type_validator_to_short
 from ..db import get_db, User, POI
-from ..auth import get_current_user
-from ..osm_api import OSMAPIClient
+from ..auth import get_current_user, get_osm_access_token
+from ..osm_api import OSMAPIClient, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -41,37 +44,50 @@ class OSMEditResponse(BaseModel):
 async def confirm_poi_info(
     request: ConfirmInfoRequest,
     current_user: User = Depends(get_current_user),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
     db: Session = Depends(get_db),
 ):
     """Confirm POI information is correct by adding check_date tag."""
-    poi = (
-        db.query(POI)
-        .filter(POI.osm_type == request.poi_osm_type, POI.osm_id == request.poi_osm_id)
-        .first()
-    )
+    poi = db.execute(
+        select(POI).where(
+            POI.osm_type == request.poi_osm_type, POI.osm_id == request.poi_osm_id
+        )
+    ).scalar_one_or_none()
     logger.info(
-        f"User {current_user.username} is confirming info for POI {request.poi_osm_type}/{request.poi_osm_id}"
+        "User %s is confirming info for POI %s/%s",
+        current_user.username,
+        request.poi_osm_type,
+        request.poi_osm_id,
     )
     if not poi:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="POI not found"
         )
 
-    osm_client = OSMAPIClient(current_user.osm_access_token)
+    osm_client = OSMAPIClient(get_osm_access_token(db, current_user), http_client)
 
     try:
         poi_data = POIResponse.model_validate(poi)
-        logger.info(
-            f"Adding/updating check_date tag for OSM element {poi.osm_type}/{poi.osm_id}"
-        )
+        logger.debug("check_date update %s/%s", poi.osm_type, poi.osm_id)
         result = await osm_client.add_check_date(poi=poi_data)
 
-        logger.debug(f"Result from add_check_date: {result}")
-
-        if poi.tags is None:
-            poi.tags = {}
-        poi.tags["check_date"] = result["check_date"]
-        poi.version = result["new_version"]
+        logger.debug("Result from add_check_date: %s", result)
+
+        # Patch the stored tags in place in Postgres rather than flushing the
+        # whole ORM row; the loaded `poi` is not used afterwards.
+        db.execute(
+            update(POI)
+            .where(POI.osm_type == poi.osm_type, POI.osm_id == poi.osm_id)
+            .values(
+                tags=func.jsonb_set(
+                    func.coalesce(POI.tags, cast({}, JSONB)),
+                    literal(["check_date"], ARRAY(Text)),
+                    cast(result["check_date"], JSONB),
+                ),
+                version=result["new_version"],
+            )
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
 
         logger.debug("About to create OSMEditResponse")
@@ -89,7 +105,7 @@ async def confirm_poi_info(
         raise
     except Exception as e:
         logger.error(
-            f"Failed to update OSM element: {type(e).__name__}: {str(e)}", exc_info=True
+            "Failed to update OSM element: %s: %s", type(e).__name__, e, exc_info=True
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -118,30 +134,35 @@ class NoteResponse(BaseModel):
 async def create_osm_note(
     request: NoteRequest,
     current_user: User = Depends(get_current_user),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
     db: Session = Depends(get_db),
 ):
     """Create a note in OpenStreetMap."""
 
-    poi = (
-        db.query(POI)
-        .filter(POI.osm_type == request.poi_osm_type, POI.osm_id == request.poi_osm_id)
-        .first()
-    )
+    # Only the location is needed to place the note
+    poi = db.execute(
+        select(POI)
+        .options(load_only(POI.geom))
+        .where(POI.osm_type == request.poi_osm_type, POI.osm_id == request.poi_osm_id)
+    ).scalar_one_or_none()
     if not poi:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="POI not found"
         )
 
-    osm_client = OSMAPIClient(current_user.osm_access_token)
+    osm_client = OSMAPIClient(get_osm_access_token(db, current_user), http_client)
 
     try:
         logger.debug(
-            f"Creating OSM note at lat={poi.lat}, lon={poi.lon}, text='{request.text}'"
+            "Creating OSM note at lat=%s, lon=%s, text=%r",
+            poi.lat,
+            poi.lon,
+            request.text,
         )
         note_id = await osm_client.create_note(
             lat=poi.lat, lon=poi.lon, text=request.text
         )
-        logger.debug(f"Successfully created OSM note with ID: {note_id}")
+        logger.debug("Successfully created OSM note with ID: %s", note_id)
 
         return NoteResponse(
             success=True, note_id=note_id, message="Successfully created OSM note."
@@ -150,7 +171,7 @@ async def create_osm_note(
         raise
     except Exception as e:
         logger.error(
-            f"Failed to create OSM note: {type(e).__name__}: {str(e)}", exc_info=True
+            "Failed to create OSM note: %s: %s", type(e).__name__, e, exc_info=True
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
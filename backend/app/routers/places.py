@@ -1,16 +1,38 @@
 """Places/POI endpoints."""
 
 from typing import List
+import base64
+import binascii
+import json
+import math
 import time
 from datetime import datetime, timedelta
+from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, Depends
 from fastapi import Response
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, literal_column
-from ..db import get_db, POI, CheckIn
+from geoalchemy2 import Geography
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import NullType
+from sqlalchemy import (
+    Numeric,
+    Text,
+    and_,
+    cast,
+    func,
+    or_,
+    literal,
+    literal_column,
+    select,
+    true,
+    tuple_,
+)
+from .. import config
+from ..cache import TTLCache
+from ..db import get_async_db, POI, CheckIn, poi_searchable
 from ..auth import get_current_user, User
 from ..models import (
     NormalizeOsmType,
+    osm_type_validator_to_full,
     POIResponse,
     POINearbyRequest,
     POISearchRequest,
@@ -36,11 +58,156 @@ if Histogram is not None:
 
 router = APIRouter(prefix="/places", tags=["places"])
 
+# Shortest ground distance covered by one degree of latitude / of longitude at the
+# equator. Using the lower bound keeps the search envelope a superset of the radius.
+METERS_PER_DEGREE_LAT = 110_574.0
+METERS_PER_DEGREE_LON = 111_320.0
+
+
+def make_point(lon: float, lat: float):
+    """WGS84 point geometry from bound coordinates (no WKT formatting/parsing)."""
+    return func.ST_SetSRID(func.ST_MakePoint(lon, lat), 4326)
+
+
+def make_geog_point(lon: float, lat: float):
+    """Geography counterpart of `make_point` for geodesic distance checks."""
+    return cast(make_point(lon, lat), Geography("POINT", srid=4326))
+
+
+def radius_envelope(lon: float, lat: float, radius: float):
+    """Return a lon/lat box that contains every point within `radius` meters.
+
+    Used as a cheap `&&` prefilter on the GiST-indexed geometry so the exact
+    geodesic distance only runs on points that can actually be in range.
+    """
+    lat_delta = radius / METERS_PER_DEGREE_LAT
+    # Longitude degrees shrink towards the poles; size the box for the edge
+    # of the search area that is furthest from the equator.
+    widest_lat = abs(lat) + lat_delta
+    if widest_lat < 90.0:
+        lon_delta = radius / (
+            METERS_PER_DEGREE_LON * math.cos(math.radians(widest_lat))
+        )
+        west, east = lon - lon_delta, lon + lon_delta
+    if widest_lat >= 90.0 or west < -180.0 or east > 180.0:
+        # The area reaches a pole or wraps across the antimeridian, which a
+        # single lon/lat box cannot express; keep only the latitude bounds.
+        west, east = -180.0, 180.0
+    return func.ST_MakeEnvelope(west, lat - lat_delta, east, lat + lat_delta, 4326)
+
+
+_classes_cache = TTLCache(maxsize=1, ttl=config.CLASSES_CACHE_TTL_SECONDS)
+
+# Response header carrying the cursor for the page after the current one
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*key) -> str:
+    """Encode the sort key of a page's last row as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str, key_types: tuple) -> list:
+    """Decode a cursor, checking it matches the endpoint's sort key shape."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error):
+        key = None
+    if (
+        not isinstance(key, list)
+        or len(key) != len(key_types)
+        or not all(
+            isinstance(value, expected) and not isinstance(value, bool)
+            for value, expected in zip(key, key_types)
+        )
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
+
+
+def paginate(query, sort_key: tuple, key_types: tuple, cursor, offset: int, limit: int):
+    """Order by `sort_key` and page by cursor (keyset seek) or, without one, offset."""
+    query = query.order_by(*sort_key)
+    if cursor:
+        # Distances are compared as NUMERIC; going through str() keeps 152.3
+        # from being bound as 152.29999999999998 (and repeating that row).
+        after = [
+            Decimal(str(value)) if isinstance(value, float) else value
+            for value in decode_cursor(cursor, key_types)
+        ]
+        # Bind each value with its column's type so osm_id is sent as BIGINT
+        # (most node ids overflow int4); untyped expressions such as round()
+        # keep the type inferred from the value.
+        bound = [
+            literal(value, None if isinstance(key.type, NullType) else key.type)
+            for key, value in zip(sort_key, after)
+        ]
+        query = query.filter(tuple_(*sort_key) > tuple_(*bound))
+    else:
+        query = query.offset(offset)
+    return query.limit(limit)
+
+
+def tag_text(tags, key: str):
+    """`tags->>'key'` with the key inlined, so it matches expression indexes.
+
+    A bound key (`tags ->> $1`) cannot be matched to an index on
+    `(tags->>'name')` once PostgreSQL switches to a generic plan.
+    """
+    return tags.op("->>", return_type=Text)(literal_column(f"'{key}'"))
+
+
+def current_checkin(user_id: int):
+    """One-row CTE with the POI of the user's latest check-in, if any."""
+    return (
+        select(CheckIn.poi_osm_type, CheckIn.poi_osm_id)
+        .where(CheckIn.user_id == user_id)
+        .order_by(CheckIn.created_at.desc())
+        .limit(1)
+        .cte("current_checkin")
+    )
+
+
+def checked_in_flag(c, current):
+    """`is_checked_in` column for rows of `c` left-joined ON true to `current`."""
+    return func.coalesce(
+        and_(
+            c.c.osm_type == current.c.poi_osm_type,
+            c.c.osm_id == current.c.poi_osm_id,
+        ),
+        False,
+    ).label("is_checked_in")
+
+
+def poi_response(row, is_checked_in: bool) -> POIResponse:
+    """Build a POIResponse from a list query row without re-validating it.
+
+    The columns are already typed by the database, so only the osm_type
+    mapping done by the model's validator is applied here.
+    """
+    return POIResponse.model_construct(
+        osm_id=row.osm_id,
+        osm_type=osm_type_validator_to_full(row.osm_type),
+        name=row.name,
+        poi_class=row.poi_class,
+        lat=float(row.lat) if row.lat is not None else None,
+        lon=float(row.lon) if row.lon is not None else None,
+        tags=row.tags or {},
+        version=row.version,
+        timestamp=row.timestamp,
+        distance=float(row.distance) if row.distance is not None else None,
+        is_checked_in=is_checked_in,
+    )
+
+
+# Sort key value types for distance-ordered pages: (distance, osm_type, osm_id)
+DISTANCE_KEY_TYPES = ((int, float), str, int)
+
 
 @router.post("/nearby", response_model=List[POIResponse])
 async def get_nearby_places(
     request: POINearbyRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     response: Response = None,  # injected by FastAPI
 ):
@@ -56,104 +223,84 @@ async def get_nearby_places(
     db_t0 = time.perf_counter()
 
     candidate_cap = 500
-    knn_order = POI.geom.op("<->")(
-        func.ST_SetSRID(func.ST_MakePoint(request.lon, request.lat), 4326)
-    )
-
-    candidates = db.query(
-        POI.osm_type,
-        POI.osm_id,
-        POI.name,
-        POI.poi_class,
-        POI.tags,
-        POI.geom,
-        POI.version,
-        POI.timestamp,
+    S = poi_searchable.c
+    knn_order = S.geom.op("<->")(make_point(request.lon, request.lat))
+
+    # poi_searchable already excludes bus stops and carries the geography cast
+    candidates = select(
+        S.osm_type,
+        S.osm_id,
+        S.name,
+        S.poi_class,
+        S.tags,
+        S.geom,
+        S.geog,
+        S.version,
+        S.timestamp,
     )
-    # filter out highway=bus_stop for now
+    if request.poi_class:
+        candidates = candidates.filter(S.poi_class.in_(request.poi_class))
     candidates = candidates.filter(
-        or_(
-            POI.tags.op("->>")("highway") != "bus_stop",
-            POI.tags.op("->>")("highway").is_(None),
-        )
+        S.geom.op("&&")(radius_envelope(request.lon, request.lat, request.radius))
     )
-    if request.poi_class:
-        candidates = candidates.filter(POI.poi_class == request.poi_class)
     candidates = candidates.order_by(knn_order).limit(candidate_cap)
 
-    c = candidates.subquery("c")
-
-    distance_expr = func.ST_Distance(
-        func.ST_GeogFromWKB(c.c.geom),
-        func.ST_GeographyFromText(f"POINT({request.lon} {request.lat})"),
-    ).label("distance")
+    # Materialize the KNN candidates so the geodesic distance and the radius
+    # filter below only run on this bounded set.
+    c = candidates.cte("c").prefix_with("MATERIALIZED")
+    origin = make_geog_point(request.lon, request.lat)
+
+    distance = func.ST_Distance(c.c.geog, origin)
+    # Pages are keyed on the distance as returned to clients (0.1 m precision),
+    # so the last row's values form the next cursor.
+    page_distance = func.round(cast(distance, Numeric), 1)
+    distance_expr = page_distance.label("distance")
+
+    if request.radius == 0:
+        # Exact-location lookups: a planar intersects test is cheaper than a
+        # zero-distance geodesic ST_DWithin and answers the same question.
+        radius_filter = func.ST_Intersects(
+            c.c.geom, make_point(request.lon, request.lat)
+        )
+    else:
+        radius_filter = func.ST_DWithin(c.c.geog, origin, request.radius)
 
+    current = current_checkin(current_user.id)
     final_query = (
-        db.query(
+        select(
             c.c.osm_type,
             c.c.osm_id,
             c.c.name,
             c.c.poi_class,
             c.c.tags,
-            func.ST_AsEWKB(c.c.geom).label("geom"),
-            func.ST_Y(func.ST_AsText(c.c.geom)).label("lat"),
-            func.ST_X(func.ST_AsText(c.c.geom)).label("lon"),
+            func.ST_Y(c.c.geom).label("lat"),
+            func.ST_X(c.c.geom).label("lon"),
             c.c.version,
             c.c.timestamp,
             distance_expr,
+            checked_in_flag(c, current),
         )
-        .filter(
-            func.ST_DWithin(
-                func.ST_GeogFromWKB(c.c.geom),
-                func.ST_GeographyFromText(f"POINT({request.lon} {request.lat})"),
-                request.radius,
-            )
-        )
-        .order_by(literal_column("distance"))
-        .offset(request.offset)
-        .limit(request.limit)
+        .outerjoin(current, true())
+        .filter(radius_filter)
+    )
+    final_query = paginate(
+        final_query,
+        (page_distance, c.c.osm_type, c.c.osm_id),
+        DISTANCE_KEY_TYPES,
+        request.cursor,
+        request.offset,
+        request.limit,
     )
 
-    results = final_query.all()
+    results = (await db.execute(final_query)).all()
     db_elapsed = time.perf_counter() - db_t0
 
     # Record Prometheus metric if available
     if _nearby_query_hist is not None:
         _nearby_query_hist.labels("true" if has_class else "false").observe(db_elapsed)
 
-    # Get user's most recent check-in (current location)
-    most_recent_checkin = (
-        db.query(CheckIn.poi_osm_type, CheckIn.poi_osm_id)
-        .filter(CheckIn.user_id == current_user.id)
-        .order_by(CheckIn.created_at.desc())
-        .first()
-    )
-
-    # Get the current checked-in POI (if any)
-    current_checkin_poi = None
-    if most_recent_checkin:
-        current_checkin_poi = (
-            most_recent_checkin.poi_osm_type,
-            most_recent_checkin.poi_osm_id,
-        )
-
     # Convert to response format
-    pois = []
-    for row in results:
-        poi_data = POIResponse(
-            osm_id=row.osm_id,
-            osm_type=row.osm_type,
-            name=row.name,
-            **{"class": row.poi_class},
-            lat=float(row.lat),
-            lon=float(row.lon),
-            tags=row.tags or {},
-            version=row.version,
-            timestamp=row.timestamp,
-        )
-        poi_data.distance = round(float(row.distance), 1)
-        poi_data.is_checked_in = current_checkin_poi == (row.osm_type, row.osm_id)
-        pois.append(poi_data)
+    pois = [poi_response(row, row.is_checked_in) for row in results]
 
     # Add basic Server-Timing header (db, app)
     total_elapsed = time.perf_counter() - app_t0
@@ -163,6 +310,11 @@ async def get_nearby_places(
         response.headers["Server-Timing"] = (
             f"db;dur={db_elapsed*1000:.1f}, app;dur={app_elapsed*1000:.1f}"
         )
+        if len(results) == request.limit:
+            last = results[-1]
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                float(last.distance), last.osm_type, last.osm_id
+            )
 
     return pois
 
@@ -170,7 +322,7 @@ async def get_nearby_places(
 @router.post("/bbox", response_model=List[POIResponse])
 async def get_places_in_bbox(
     request: POIBboxRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     response: Response = None,
 ):
@@ -193,130 +345,99 @@ async def get_places_in_bbox(
     # Handle dateline crossing
     crosses_dateline = request.east < request.west
 
-    # Create the bounding box polygon
-    # PostGIS expects: POLYGON((lon lat, lon lat, ...))
-    # Order: bottom-left, bottom-right, top-right, top-left, bottom-left (closed)
-    if crosses_dateline:
-        # For dateline crossing, we need to use two separate bboxes or a different approach
-        # For now, we'll use ST_MakeEnvelope which doesn't handle dateline crossing well
-        # A production solution might split this into two queries
-        bbox_wkt = f"POLYGON(({request.west} {request.south}, 180 {request.south}, 180 {request.north}, {request.west} {request.north}, {request.west} {request.south}))"
-        bbox_wkt_2 = f"POLYGON((-180 {request.south}, {request.east} {request.south}, {request.east} {request.north}, -180 {request.north}, -180 {request.south}))"
-    else:
-        bbox_wkt = f"POLYGON(({request.west} {request.south}, {request.east} {request.south}, {request.east} {request.north}, {request.west} {request.north}, {request.west} {request.south}))"
-
-    # Base query with filters
-    candidates = db.query(
-        POI.osm_type,
-        POI.osm_id,
-        POI.name,
-        POI.poi_class,
-        POI.tags,
-        POI.geom,
-        POI.version,
-        POI.timestamp,
-    )
-
-    # Filter out highway=bus_stop for consistency with nearby endpoint
-    candidates = candidates.filter(
-        or_(
-            POI.tags.op("->>")("highway") != "bus_stop",
-            POI.tags.op("->>")("highway").is_(None),
-        )
+    # Base query; poi_searchable already excludes bus stops
+    S = poi_searchable.c
+    candidates = select(
+        S.osm_type,
+        S.osm_id,
+        S.name,
+        S.poi_class,
+        S.tags,
+        S.geom,
+        S.geog,
+        S.version,
+        S.timestamp,
     )
 
     # Apply class filter if provided
     if request.poi_class:
-        candidates = candidates.filter(POI.poi_class == request.poi_class)
+        candidates = candidates.filter(S.poi_class.in_(request.poi_class))
 
     # Apply bounding box filter
     if crosses_dateline:
-        # Handle dateline crossing with OR condition
-        bbox_geom = func.ST_GeomFromText(bbox_wkt, 4326)
-        bbox_geom_2 = func.ST_GeomFromText(bbox_wkt_2, 4326)
+        # Split a dateline-crossing box into its western and eastern halves
+        bbox_geom = func.ST_MakeEnvelope(
+            request.west, request.south, 180, request.north, 4326
+        )
+        bbox_geom_2 = func.ST_MakeEnvelope(
+            -180, request.south, request.east, request.north, 4326
+        )
         candidates = candidates.filter(
             or_(
-                func.ST_Within(POI.geom, bbox_geom),
-                func.ST_Within(POI.geom, bbox_geom_2)
+                func.ST_Within(S.geom, bbox_geom),
+                func.ST_Within(S.geom, bbox_geom_2)
             )
         )
     else:
-        bbox_geom = func.ST_GeomFromText(bbox_wkt, 4326)
-        candidates = candidates.filter(func.ST_Within(POI.geom, bbox_geom))
+        bbox_geom = func.ST_MakeEnvelope(
+            request.west, request.south, request.east, request.north, 4326
+        )
+        candidates = candidates.filter(func.ST_Within(S.geom, bbox_geom))
 
     # Calculate center point for distance ordering
     center_lat = (request.north + request.south) / 2
     center_lon = (request.east + request.west) / 2
 
     # Use KNN ordering from center point
-    knn_order = POI.geom.op("<->")(
-        func.ST_SetSRID(func.ST_MakePoint(center_lon, center_lat), 4326)
-    )
+    knn_order = S.geom.op("<->")(make_point(center_lon, center_lat))
 
     candidates = candidates.order_by(knn_order)
     c = candidates.subquery("c")
 
-    # Calculate distance from center for each result
-    distance_expr = func.ST_Distance(
-        func.ST_GeogFromWKB(c.c.geom),
-        func.ST_GeographyFromText(f"POINT({center_lon} {center_lat})"),
-    ).label("distance")
+    # Calculate distance from center for each result, rounded in SQL
+    center_distance = func.round(
+        cast(
+            func.ST_Distance(
+                c.c.geog,
+                make_geog_point(center_lon, center_lat),
+            ),
+            Numeric,
+        ),
+        1,
+    )
+    distance_expr = center_distance.label("distance")
 
+    current = current_checkin(current_user.id)
     final_query = (
-        db.query(
+        select(
             c.c.osm_type,
             c.c.osm_id,
             c.c.name,
             c.c.poi_class,
             c.c.tags,
-            func.ST_AsEWKB(c.c.geom).label("geom"),
-            func.ST_Y(func.ST_AsText(c.c.geom)).label("lat"),
-            func.ST_X(func.ST_AsText(c.c.geom)).label("lon"),
+            func.ST_Y(c.c.geom).label("lat"),
+            func.ST_X(c.c.geom).label("lon"),
             c.c.version,
             c.c.timestamp,
             distance_expr,
+            checked_in_flag(c, current),
         )
-        .order_by(literal_column("distance"))
-        .offset(request.offset)
-        .limit(request.limit)
+        .outerjoin(current, true())
     )
-
-    results = final_query.all()
-    db_elapsed = time.perf_counter() - db_t0
-
-    # Get user's most recent check-in (current location)
-    most_recent_checkin = (
-        db.query(CheckIn.poi_osm_type, CheckIn.poi_osm_id)
-        .filter(CheckIn.user_id == current_user.id)
-        .order_by(CheckIn.created_at.desc())
-        .first()
+    final_query = paginate(
+        final_query,
+        (center_distance, c.c.osm_type, c.c.osm_id),
+        DISTANCE_KEY_TYPES,
+        request.cursor,
+        request.offset,
+        request.limit,
     )
 
-    # Get the current checked-in POI (if any)
-    current_checkin_poi = None
-    if most_recent_checkin:
-        current_checkin_poi = (
-            most_recent_checkin.poi_osm_type,
-            most_recent_checkin.poi_osm_id,
-        )
+    results = (await db.execute(final_query)).all()
+    db_elapsed = time.perf_counter() - db_t0
 
     # Convert to response format
-    pois = []
-    for row in results:
-        poi_data = POIResponse(
-            osm_id=row.osm_id,
-            osm_type=row.osm_type,
-            name=row.name,
-            **{"class": row.poi_class},
-            lat=float(row.lat),
-            lon=float(row.lon),
-            tags=row.tags or {},
-            version=row.version,
-            timestamp=row.timestamp,
-        )
-        poi_data.distance = round(float(row.distance), 1)
-        poi_data.is_checked_in = current_checkin_poi == (row.osm_type, row.osm_id)
-        pois.append(poi_data)
+    pois = [poi_response(row, row.is_checked_in) for row in results]
 
     # Add Server-Timing header
     total_elapsed = time.perf_counter() - app_t0
@@ -325,6 +446,11 @@ async def get_places_in_bbox(
         response.headers["Server-Timing"] = (
             f"db;dur={db_elapsed*1000:.1f}, app;dur={app_elapsed*1000:.1f}"
         )
+        if len(results) == request.limit:
+            last = results[-1]
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                float(last.distance), last.osm_type, last.osm_id
+            )
 
     return pois
 
@@ -332,7 +458,7 @@ async def get_places_in_bbox(
 @router.post("/search", response_model=List[POIResponse])
 async def search_places(
     request: POISearchRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     response: Response = None,
 ):
@@ -341,99 +467,97 @@ async def search_places(
     db_t0 = time.perf_counter()
 
     has_coords = request.lat is not None and request.lon is not None
-    lowered_query = f"%{request.query.lower()}%"
+    pattern = f"%{request.query}%"
 
+    S = poi_searchable.c
+    # Bare ILIKE on these expressions matches the trigram GIN indexes of
+    # poi_searchable; NULL columns simply don't match
     text_filter = or_(
-        func.lower(func.coalesce(POI.name, "")).like(lowered_query),
-        func.lower(func.coalesce(POI.tags.op("->>")("name"), "")).like(lowered_query),
-        func.lower(func.coalesce(POI.tags.op("->>")("name:en"), "")).like(
-            lowered_query
-        ),
-        func.lower(func.coalesce(POI.tags.op("->>")("brand"), "")).like(lowered_query),
+        S.name.ilike(pattern),
+        tag_text(S.tags, "name").ilike(pattern),
+        tag_text(S.tags, "name:en").ilike(pattern),
+        tag_text(S.tags, "brand").ilike(pattern),
     )
 
     # Base select columns
     base_columns = [
-        POI.osm_type,
-        POI.osm_id,
-        POI.name,
-        POI.poi_class,
-        POI.tags,
-        POI.geom,
-        POI.version,
-        POI.timestamp,
+        S.osm_type,
+        S.osm_id,
+        S.name,
+        S.poi_class,
+        S.tags,
+        S.geom,
+        S.version,
+        S.timestamp,
     ]
 
-    # Filter out transport noise consistent with nearby endpoint
-    base_query = db.query(*base_columns).filter(
-        or_(
-            POI.tags.op("->>")("highway") != "bus_stop",
-            POI.tags.op("->>")("highway").is_(None),
-        )
-    )
-    base_query = base_query.filter(text_filter)
+    # poi_searchable already filters out transport noise (bus stops)
+    base_query = select(*base_columns).where(text_filter)
 
     if has_coords:
-        point = func.ST_SetSRID(func.ST_MakePoint(request.lon, request.lat), 4326)
-        knn_order = POI.geom.op("<->")(point)
+        point = make_point(request.lon, request.lat)
+        knn_order = S.geom.op("<->")(point)
         candidate_cap = 500
 
-        candidates = base_query.order_by(knn_order).limit(candidate_cap)
-        c = candidates.subquery("c_search")
+        candidates = (
+            base_query.add_columns(S.geog)
+            .filter(
+                S.geom.op("&&")(
+                    radius_envelope(request.lon, request.lat, request.radius)
+                )
+            )
+            .order_by(knn_order)
+            .limit(candidate_cap)
+        )
+        c = candidates.cte("c_search").prefix_with("MATERIALIZED")
+        origin = make_geog_point(request.lon, request.lat)
 
-        distance_expr = func.ST_Distance(
-            func.ST_GeogFromWKB(c.c.geom),
-            func.ST_GeographyFromText(f"POINT({request.lon} {request.lat})"),
-        ).label("distance")
+        page_distance = func.round(cast(func.ST_Distance(c.c.geog, origin), Numeric), 1)
+        distance_expr = page_distance.label("distance")
 
         final_query = (
-            db.query(
+            select(
                 c.c.osm_type,
                 c.c.osm_id,
                 c.c.name,
                 c.c.poi_class,
                 c.c.tags,
-                func.ST_AsEWKB(c.c.geom).label("geom"),
-                func.ST_Y(func.ST_AsText(c.c.geom)).label("lat"),
-                func.ST_X(func.ST_AsText(c.c.geom)).label("lon"),
+                func.ST_Y(c.c.geom).label("lat"),
+                func.ST_X(c.c.geom).label("lon"),
                 c.c.version,
                 c.c.timestamp,
                 distance_expr,
             )
-            .filter(
-                func.ST_DWithin(
-                    func.ST_GeogFromWKB(c.c.geom),
-                    func.ST_GeographyFromText(f"POINT({request.lon} {request.lat})"),
-                    request.radius,
-                )
-            )
-            .order_by(literal_column("distance"))
-            .offset(request.offset)
-            .limit(request.limit)
+            .filter(func.ST_DWithin(c.c.geog, origin, request.radius))
         )
+        sort_key = (page_distance, c.c.osm_type, c.c.osm_id)
+        key_types = DISTANCE_KEY_TYPES
     else:
         distance_expr = literal_column("NULL").label("distance")
+        name_key = func.lower(func.coalesce(S.name, ""))
 
         final_query = (
-            base_query.with_entities(
-                POI.osm_type,
-                POI.osm_id,
-                POI.name,
-                POI.poi_class,
-                POI.tags,
-                func.ST_AsEWKB(POI.geom).label("geom"),
-                func.ST_Y(func.ST_AsText(POI.geom)).label("lat"),
-                func.ST_X(func.ST_AsText(POI.geom)).label("lon"),
-                POI.version,
-                POI.timestamp,
+            base_query.with_only_columns(
+                S.osm_type,
+                S.osm_id,
+                S.name,
+                S.poi_class,
+                S.tags,
+                func.ST_Y(S.geom).label("lat"),
+                func.ST_X(S.geom).label("lon"),
+                S.version,
+                S.timestamp,
                 distance_expr,
+                name_key.label("name_key"),
             )
-            .order_by(func.lower(func.coalesce(POI.name, "")), POI.osm_id)
-            .offset(request.offset)
-            .limit(request.limit)
         )
+        sort_key = (name_key, S.osm_type, S.osm_id)
+        key_types = (str, str, int)
 
-    results = final_query.all()
+    final_query = paginate(
+        final_query, sort_key, key_types, request.cursor, request.offset, request.limit
+    )
+    results = (await db.execute(final_query)).all()
     db_elapsed = time.perf_counter() - db_t0
 
     total_elapsed = time.perf_counter() - app_t0
@@ -442,38 +566,27 @@ async def search_places(
         response.headers["Server-Timing"] = (
             f"db;dur={db_elapsed*1000:.1f}, app;dur={app_elapsed*1000:.1f}"
         )
+        if len(results) == request.limit:
+            last = results[-1]
+            first_key = float(last.distance) if has_coords else last.name_key
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                first_key, last.osm_type, last.osm_id
+            )
 
-    pois: List[POIResponse] = []
-    for row in results:
-        poi_data = POIResponse(
-            osm_id=row.osm_id,
-            osm_type=row.osm_type,
-            name=row.name,
-            **{"class": row.poi_class},
-            lat=float(row.lat) if row.lat is not None else None,
-            lon=float(row.lon) if row.lon is not None else None,
-            tags=row.tags or {},
-            version=row.version,
-            timestamp=row.timestamp,
-        )
-        if row.distance is not None:
-            poi_data.distance = round(float(row.distance), 1)
-        else:
-            poi_data.distance = None
-        poi_data.is_checked_in = False
-        pois.append(poi_data)
-
-    return pois
+    return [poi_response(row, False) for row in results]
 
 
 @router.get("/{osm_type}/{osm_id}", response_model=POIResponse)
 async def get_place_details(
     osm_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     osm_type: str = Depends(NormalizeOsmType),
 ):
     """Get detailed information about a specific POI."""
-    poi = db.query(POI).filter(POI.osm_type == osm_type, POI.osm_id == osm_id).first()
+    result = await db.execute(
+        select(POI).where(POI.osm_type == osm_type, POI.osm_id == osm_id)
+    )
+    poi = result.scalar_one_or_none()
 
     if not poi:
         raise HTTPException(status_code=404, detail="Place not found")
@@ -481,19 +594,25 @@ async def get_place_details(
     return POIResponse.model_validate(poi)
 
 
-@router.get("/classes/list")
+@router.get("/classes/list", response_model=APIResponse)
 async def get_classes(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
 ):
     """Get list of available POI classes."""
-    classes = (
-        db.query(POI.poi_class, func.count().label("count"))
-        .group_by(POI.poi_class)
-        .all()
-    )
+    # The GROUP BY scans every POI and its result only changes with data
+    # imports, so serve it from a per-process cache.
+    data = _classes_cache.get("classes")
+    if data is None:
+        result = await db.execute(
+            select(POI.poi_class, func.count().label("count")).group_by(POI.poi_class)
+        )
+        classes = result.all()
+        data = [{"class": cls, "count": count} for cls, count in classes]
+        _classes_cache.set("classes", data)
 
     return APIResponse(
         success=True,
         message="Classes retrieved successfully",
-        data=[{"class": cls, "count": count} for cls, count in classes],
+        data=data,
     )
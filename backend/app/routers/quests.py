@@ -1,11 +1,15 @@
 """Quest endpoints."""
 
 import logging
+
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, load_only
 
 from ..db import get_db, User, POI, QuestResponse
-from ..auth import get_current_user
+from ..auth import get_current_user, get_osm_access_token
 from ..models import (
     NormalizeOsmType,
     POIResponse,
@@ -15,7 +19,7 @@ from ..models import (
     QuestRespondResponse,
 )
 from ..quests import get_applicable_quests, get_quest_by_id
-from ..osm_api import OSMAPIClient
+from ..osm_api import OSMAPIClient, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,7 @@ async def get_applicable_quests_for_poi(
     db: Session = Depends(get_db),
     osm_type: str = Depends(NormalizeOsmType),
     current_user: User = Depends(get_current_user),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """
     Get applicable quests for a POI.
@@ -47,7 +52,11 @@ async def get_applicable_quests_for_poi(
         return QuestApplicableListResponse(quests=[], total=0)
 
     # Get POI from database (for poi_class)
-    poi = db.query(POI).filter(POI.osm_type == osm_type, POI.osm_id == osm_id).first()
+    poi = db.execute(
+        select(POI)
+        .options(load_only(POI.poi_class))
+        .where(POI.osm_type == osm_type, POI.osm_id == osm_id)
+    ).scalar_one_or_none()
 
     if not poi:
         raise HTTPException(
@@ -58,7 +67,7 @@ async def get_applicable_quests_for_poi(
     logger.info(
         f"Fetching OSM data for {osm_type}/{osm_id} to determine applicable quests"
     )
-    osm_client = OSMAPIClient(current_user.osm_access_token)
+    osm_client = OSMAPIClient(get_osm_access_token(db, current_user), http_client)
 
     try:
         element_data = await osm_client.get_element(osm_id, osm_type)
@@ -108,6 +117,7 @@ async def respond_to_quest(
     request: QuestRespondRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """
     Respond to a quest by submitting an answer.
@@ -129,29 +139,37 @@ async def respond_to_quest(
         )
 
     # Get POI from database
-    poi = (
-        db.query(POI)
-        .filter(POI.osm_type == request.poi_osm_type, POI.osm_id == request.poi_osm_id)
-        .first()
-    )
+    poi = db.execute(
+        select(POI).where(
+            POI.osm_type == request.poi_osm_type, POI.osm_id == request.poi_osm_id
+        )
+    ).scalar_one_or_none()
 
     if not poi:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="POI not found"
         )
 
-    # Check if quest was already answered for this POI
-    existing_response = (
-        db.query(QuestResponse)
-        .filter(
-            QuestResponse.poi_osm_type == request.poi_osm_type,
-            QuestResponse.poi_osm_id == request.poi_osm_id,
-            QuestResponse.quest_id == request.quest_id,
+    # Snapshot before the commit below expires the loaded POI
+    poi_data = POIResponse.model_validate(poi)
+
+    # Claim the quest for this POI before editing OSM: the unique constraint
+    # turns a concurrent or repeated answer into a no-op insert, so the check
+    # and the write are one statement and only one request edits OSM
+    claimed_id = db.execute(
+        insert(QuestResponse)
+        .values(
+            poi_osm_type=request.poi_osm_type,
+            poi_osm_id=request.poi_osm_id,
+            quest_id=request.quest_id,
+            answer=request.answer,
         )
-        .first()
-    )
+        .on_conflict_do_nothing(constraint="uq_poi_quest")
+        .returning(QuestResponse.id)
+    ).scalar_one_or_none()
+    db.commit()
 
-    if existing_response:
+    if claimed_id is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="This quest has already been answered for this POI",
@@ -161,11 +179,10 @@ async def respond_to_quest(
     tags_to_apply = quest.get_tags_for_answer(request.answer)
 
     # Update OSM
-    osm_client = OSMAPIClient(current_user.osm_access_token)
+    osm_client = OSMAPIClient(get_osm_access_token(db, current_user), http_client)
     changeset_id = None
 
     try:
-        poi_data = POIResponse.model_validate(poi)
         changeset_comment = f"Quest: {quest.question} Answer: {request.answer.capitalize()} (via FourMore)"
 
         result = await osm_client.update_element_tags(
@@ -179,17 +196,14 @@ async def respond_to_quest(
         logger.error(f"Failed to update OSM: {e}")
         # Continue to record response even if OSM update fails
 
-    # Record quest response in database
-    quest_response = QuestResponse(
-        poi_osm_type=request.poi_osm_type,
-        poi_osm_id=request.poi_osm_id,
-        quest_id=request.quest_id,
-        answer=request.answer,
-        osm_changeset_id=changeset_id,
-    )
-
-    db.add(quest_response)
-    db.commit()
+    # The response row is kept even if the OSM update failed
+    if changeset_id:
+        db.execute(
+            update(QuestResponse)
+            .where(QuestResponse.id == claimed_id)
+            .values(osm_changeset_id=changeset_id)
+        )
+        db.commit()
 
     if changeset_id:
         return QuestRespondResponse(
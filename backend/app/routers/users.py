@@ -1,84 +1,74 @@
 """Current user endpoints."""
 
-from datetime import datetime
-
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, literal, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..auth import get_current_user
-from ..db import CheckIn, User, get_db
+from ..auth import get_current_user, invalidate_cached_user
+from ..db import User, get_async_db
 from ..models import APIResponse, UserResponse, UserSettingsUpdate
 
 router = APIRouter(prefix="/me", tags=["current-user"])
 
 
 @router.get("")
-async def get_current_user_info(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
-):
+async def get_current_user_info(current_user: User = Depends(get_current_user)):
     return current_user
 
 
 @router.patch("/settings", response_model=UserResponse)
 async def update_user_settings(
     settings_update: UserSettingsUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Update user settings stored in JSONB field.
     Only provided fields will be updated, preserving existing settings.
     """
-    # Get current settings or initialize empty dict
-    settings_value = getattr(current_user, "settings", None)
-    current_settings: dict = dict(settings_value) if settings_value else {}
-
-    # Update only the fields that were provided in the request
-    updated = False
-
-    if settings_update.expert is not None:
-        current_settings["expert"] = settings_update.expert
-        updated = True
-
-    if settings_update.theme is not None:
-        current_settings["theme"] = settings_update.theme
-        updated = True
+    # Only the provided settings keys are merged into the stored JSONB with
+    # ||, so concurrent updates of different keys don't overwrite each other
+    changes = settings_update.model_dump(exclude_none=True, exclude={"display_name"})
 
-    if settings_update.notifications is not None:
-        current_settings["notifications"] = settings_update.notifications
-        updated = True
-
-    if settings_update.participate_in_quests is not None:
-        current_settings["participate_in_quests"] = (
-            settings_update.participate_in_quests
-        )
-        updated = True
+    values: dict = {}
+    if changes:
+        values["settings"] = func.coalesce(User.settings, literal({}, JSONB)).op(
+            "||", return_type=JSONB
+        )(literal(changes, JSONB))
 
     if settings_update.display_name is not None:
-        setattr(current_user, "display_name", settings_update.display_name)
-        updated = True
-
-    # Update settings and timestamp if any changes were made
-    if updated:
-        setattr(current_user, "settings", current_settings)
-        setattr(current_user, "updated_at", datetime.utcnow())
-        db.commit()
-        db.refresh(current_user)
+        values["display_name"] = settings_update.display_name
+
+    # Nothing to change: return without an UPDATE or an empty commit
+    if not values:
+        return current_user
+
+    # RETURNING hands back the stored row, so no refresh SELECT is needed
+    result = await db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**values, updated_at=func.now())
+        .returning(User)
+    )
+    current_user = result.scalar_one()
+    await db.commit()
+    invalidate_cached_user(current_user.osm_user_id)
 
     return current_user
 
 
 @router.delete("")
 async def delete_account(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
 ):
     """Delete user account and all associated data."""
-    # Quest responses are stored globally per POI and are not user-owned.
-    # Deleting an account must not remove shared quest history.
-    db.query(CheckIn).filter(CheckIn.user_id == current_user.id).delete()
-
-    db.delete(current_user)
-    db.commit()
+    # Check-ins go with the user via ON DELETE CASCADE. Quest responses are
+    # stored globally per POI and are not user-owned, so they are kept.
+    await db.execute(delete(User).where(User.id == current_user.id))
+    await db.commit()
+    invalidate_cached_user(current_user.osm_user_id)
 
     return APIResponse(
         success=True, message="Account and all associated data deleted successfully"
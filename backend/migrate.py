@@ -3,7 +3,8 @@
 
 import os
 import sys
-import requests
+import asyncio
+import httpx
 from pathlib import Path
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import OperationalError
@@ -12,6 +13,18 @@ from sqlalchemy.exc import OperationalError
 sys.path.insert(0, os.path.dirname(__file__))
 from app.db import Base
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PROGRESS_STEP = 16 << 20
+# Parallel range downloads: part size and number of concurrent connections
+DOWNLOAD_PART_SIZE = 64 << 20
+DOWNLOAD_CONNECTIONS = 4
+# Retries per range after a dropped connection or 5xx, resuming where it stopped
+DOWNLOAD_RETRIES = 5
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+# Sequential access hint for the downloaded file; posix_fadvise is missing
+# on macOS
+HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
 def run_migrations():
     """Run database migrations."""
     database_url = os.getenv("DATABASE_URL")
@@ -23,20 +36,20 @@ def run_migrations():
     engine = create_engine(database_url)
 
     try:
-        # Test connection
-        with engine.connect() as conn:
+        # One connection and one transaction for the connection check, the
+        # extension and the tables; DDL is transactional in PostgreSQL, so a
+        # failure leaves nothing half-created
+        with engine.begin() as conn:
             conn.execute(text("SELECT 1"))
             print("✓ Database connection successful")
 
-        # Create PostGIS extension if it doesn't exist
-        with engine.connect() as conn:
+            # Create PostGIS extension if it doesn't exist
             conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
-            conn.commit()
             print("✓ PostGIS extension enabled")
 
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
-        print("✓ Database tables created/updated")
+            # Create all tables
+            Base.metadata.create_all(bind=conn)
+            print("✓ Database tables created/updated")
 
         # Check if we should populate with Utah data
         populate_data = os.getenv("POPULATE_UTAH_DATA", "false").lower() == "true"
@@ -68,25 +81,10 @@ def populate_utah_data():
         url = "https://download.geofabrik.de/north-america/us/utah-latest.osm.pbf"
 
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-
-            with open(utah_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-
-                        if total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            print(f"\rProgress: {progress:.1f}%", end='', flush=True)
-
+            download_file(url, utah_file)
             print(f"\n✓ Download completed: {utah_file}")
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, OSError) as e:
             print(f"ERROR: Failed to download Utah data: {e}")
             return
     else:
@@ -109,5 +107,120 @@ def populate_utah_data():
         print(f"ERROR: Failed to process Utah data: {e}")
         raise
 
+def download_file(url, dest):
+    """Download url to dest, in parallel byte ranges when the server allows it.
+
+    Data goes to a .part file that is only renamed to dest once complete, so an
+    interrupted download is never mistaken for a finished one.
+    """
+    dest = Path(dest)
+    part_file = dest.with_name(dest.name + ".part")
+    asyncio.run(_download(url, part_file))
+    part_file.replace(dest)
+
+async def _download(url, dest):
+    timeout = httpx.Timeout(30.0, read=60.0)
+    transport = httpx.AsyncHTTPTransport(
+        retries=DOWNLOAD_RETRIES,
+        limits=httpx.Limits(max_connections=DOWNLOAD_CONNECTIONS),
+    )
+    async with httpx.AsyncClient(
+        follow_redirects=True, timeout=timeout, transport=transport
+    ) as client:
+        head = await client.head(url)
+        head.raise_for_status()
+        total_size = int(head.headers.get('content-length', 0))
+        progress = _Progress(total_size)
+
+        if total_size == 0 or head.headers.get('accept-ranges') != 'bytes':
+            await _download_stream(client, url, dest, progress)
+            return
+
+        # Preallocate the file and let each range write its own region
+        fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, total_size)
+            if HAS_FADVISE:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            ranges = [
+                (start, min(start + DOWNLOAD_PART_SIZE, total_size) - 1)
+                for start in range(0, total_size, DOWNLOAD_PART_SIZE)
+            ]
+            semaphore = asyncio.Semaphore(DOWNLOAD_CONNECTIONS)
+            await asyncio.gather(*(
+                _download_range(client, url, fd, start, end, semaphore, progress)
+                for start, end in ranges
+            ))
+        finally:
+            os.close(fd)
+        progress.done()
+
+async def _download_range(client, url, fd, start, end, semaphore, progress):
+    """Fetch bytes start-end into fd, resuming from the last written byte after
+    a dropped connection or a 5xx response."""
+    offset = start
+    async with semaphore:
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(2 ** (attempt - 1))
+            headers = {'Range': f'bytes={offset}-{end}'}
+            try:
+                async with client.stream('GET', url, headers=headers) as response:
+                    if response.status_code in RETRY_STATUS_CODES:
+                        error = httpx.HTTPError(
+                            f"Got {response.status_code} for range {offset}-{end}"
+                        )
+                        continue
+                    if response.status_code != 206:
+                        raise httpx.HTTPError(
+                            f"Expected 206 for range {offset}-{end}, "
+                            f"got {response.status_code}"
+                        )
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                        progress.add(len(chunk))
+            except httpx.TransportError as exc:
+                error = exc
+                continue
+            if offset == end + 1:
+                return
+            error = httpx.HTTPError(f"Range {start}-{end} ended early at byte {offset}")
+    raise error
+
+async def _download_stream(client, url, dest, progress):
+    """Single-connection fallback for servers without range support."""
+    async with client.stream('GET', url) as response:
+        response.raise_for_status()
+        with open(dest, 'wb') as f:
+            if HAS_FADVISE:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                progress.add(len(chunk))
+    progress.done()
+
+class _Progress:
+    """Prints download progress every PROGRESS_STEP bytes instead of every chunk."""
+
+    def __init__(self, total_size):
+        self.total_size = total_size
+        self.downloaded = 0
+        self.last_report = 0
+
+    def add(self, size):
+        self.downloaded += size
+        if self.total_size > 0 and self.downloaded - self.last_report >= PROGRESS_STEP:
+            self.last_report = self.downloaded
+            self._print()
+
+    def done(self):
+        if self.total_size > 0:
+            self._print()
+
+    def _print(self):
+        progress = (self.downloaded / self.total_size) * 100
+        print(f"\rProgress: {progress:.1f}%", end='', flush=True)
+
 if __name__ == "__main__":
     run_migrations()
\ No newline at end of file
@@ -0,0 +1,10 @@
+-- Migration: Add composite index for a user's latest check-in
+-- Description: The nearby/bbox queries join the user's most recent check-in to flag checked-in places; this index turns that lookup into a single index probe
+-- Date: 2026-10-15
+
+-- CONCURRENTLY keeps check-ins writable during the build; it cannot run inside
+-- a transaction block, so apply this file without psql's --single-transaction
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_checkins_user_created ON checkins (user_id, created_at DESC);
+
+-- Comments for documentation
+COMMENT ON INDEX idx_checkins_user_created IS 'Latest check-in per user (ORDER BY created_at DESC LIMIT 1)';
@@ -0,0 +1,53 @@
+-- Migration: Cascade check-in deletion from users
+-- Description: Adds a foreign key from checkins.user_id to users.id with ON DELETE CASCADE so deleting an account is a single DELETE on users
+-- Date: 2026-10-15
+
+-- Check-ins whose user no longer exists are unreachable and would block the constraint
+DELETE FROM checkins c WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = c.user_id);
+
+-- Databases created by create_all after this change already have the
+-- cascading foreign key, so only add it when it is missing (replacing a
+-- non-cascading one). NOT VALID adds the constraint without scanning
+-- checkins under an exclusive lock.
+DO $$
+DECLARE
+    existing RECORD;
+BEGIN
+    SELECT conname, confdeltype INTO existing
+    FROM pg_constraint
+    WHERE conrelid = 'checkins'::regclass
+      AND confrelid = 'users'::regclass
+      AND contype = 'f';
+
+    IF FOUND AND existing.confdeltype = 'c' THEN
+        RETURN;
+    END IF;
+    IF FOUND THEN
+        EXECUTE format('ALTER TABLE checkins DROP CONSTRAINT %I', existing.conname);
+    END IF;
+
+    ALTER TABLE checkins
+        ADD CONSTRAINT checkins_user_id_fkey
+        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE NOT VALID;
+END $$;
+
+-- A separate statement, so VALIDATE checks existing rows in its own
+-- transaction while writes continue; skipped once the constraint is valid
+DO $$
+DECLARE
+    fk_name name;
+BEGIN
+    SELECT conname INTO fk_name
+    FROM pg_constraint
+    WHERE conrelid = 'checkins'::regclass
+      AND confrelid = 'users'::regclass
+      AND contype = 'f'
+      AND NOT convalidated;
+
+    IF FOUND THEN
+        EXECUTE format('ALTER TABLE checkins VALIDATE CONSTRAINT %I', fk_name);
+    END IF;
+END $$;
+
+-- Comments for documentation
+COMMENT ON CONSTRAINT checkins_user_id_fkey ON checkins IS 'Check-ins are removed together with their user; quest_responses are global and not affected';
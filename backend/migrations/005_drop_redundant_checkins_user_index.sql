@@ -0,0 +1,6 @@
+-- Migration: Drop the single-column checkins.user_id index
+-- Description: idx_checkins_user_created (user_id, created_at DESC) has user_id as its leading column and serves every user_id lookup, including the ON DELETE CASCADE from users, so ix_checkins_user_id only costs writes and cache
+-- Date: 2026-10-15
+
+-- Run outside a transaction block (CONCURRENTLY), after 003
+DROP INDEX CONCURRENTLY IF EXISTS ix_checkins_user_id;
@@ -31,3 +31,72 @@ async def test_auth_callback_rejects_invalid_state_before_token_exchange() -> No
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail == "Invalid or expired OAuth state"
     exchange_code_for_token.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_reuses_cached_user_until_invalidated(
+    monkeypatch,
+) -> None:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.auth import (
+        _user_cache,
+        create_access_token,
+        get_current_user,
+        invalidate_cached_user,
+    )
+    from app.db import User
+
+    # The cache is opt-in; enable it for this test
+    monkeypatch.setattr(_user_cache, "ttl", 60)
+    credentials = MagicMock(credentials=create_access_token({"sub": "777"}))
+    stored = User(
+        id=5,
+        osm_user_id="777",
+        username="mapper",
+        settings={},
+        osm_access_token="secret",
+    )
+    first_db = AsyncMock()
+    first_db.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=stored)
+    )
+
+    try:
+        assert await get_current_user(credentials=credentials, db=first_db) is stored
+        # OSM credentials are never kept in the cache
+        assert "osm_access_token" not in _user_cache.get("777")
+
+        # A second request hits the cache and attaches the user without a query
+        second_db = AsyncSession()
+        user = await get_current_user(credentials=credentials, db=second_db)
+        assert user.id == 5 and user.username == "mapper"
+        assert user in second_db
+
+        invalidate_cached_user("777")
+        third_db = AsyncMock()
+        third_db.execute.return_value = MagicMock(
+            scalar_one_or_none=MagicMock(return_value=stored)
+        )
+        await get_current_user(credentials=credentials, db=third_db)
+        third_db.execute.assert_awaited_once()
+    finally:
+        invalidate_cached_user("777")
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_ends_lookup_transaction() -> None:
+    from app.auth import create_access_token, get_current_user
+    from app.db import User
+
+    credentials = MagicMock(credentials=create_access_token({"sub": "888"}))
+    stored = User(id=6, osm_user_id="888", username="mapper", settings={})
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=stored)
+    )
+
+    assert await get_current_user(credentials=credentials, db=db) is stored
+
+    # The connection must not stay idle in transaction while the handler runs
+    db.commit.assert_awaited_once_with()
@@ -0,0 +1,30 @@
+import json
+import os
+
+from app.routers.categories import load_category_mapping
+
+MAPPING = [
+    {
+        "class": "cafe",
+        "label": "Cafe",
+        "icon": "IconCoffee",
+        "matches": ["amenity=cafe"],
+    },
+    {"class": "misc", "label": "Other", "icon": "IconMapPin", "is_fallback": True},
+]
+
+
+def test_load_category_mapping_caches_until_file_changes(tmp_path) -> None:
+    path = tmp_path / "category_mapping.json"
+    path.write_text(json.dumps(MAPPING))
+
+    first = load_category_mapping(path)
+    assert load_category_mapping(path) is first
+
+    path.write_text(json.dumps([{**MAPPING[0], "label": "Coffee"}, MAPPING[1]]))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = load_category_mapping(path)
+    assert reloaded is not first
+    assert reloaded[0]["label"] == "Coffee"
@@ -0,0 +1,21 @@
+from unittest.mock import patch
+
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Point
+
+from app import database_models
+from app.database_models import POI
+
+
+def test_poi_coordinates_parse_geometry_once() -> None:
+    poi = POI(geom=from_shape(Point(5.1, 52.1), srid=4326))
+
+    with patch.object(
+        database_models, "to_shape", wraps=database_models.to_shape
+    ) as to_shape:
+        assert (poi.lat, poi.lon) == (52.1, 5.1)
+        assert to_shape.call_count == 1
+
+        poi.geom = from_shape(Point(6.0, 7.0), srid=4326)
+        assert (poi.lat, poi.lon) == (7.0, 6.0)
+        assert to_shape.call_count == 2
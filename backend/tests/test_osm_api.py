@@ -0,0 +1,22 @@
+import httpx
+import pytest
+
+from app.osm_api import OSM_API_BASE, OSMAPIClient
+
+
+@pytest.mark.asyncio
+async def test_client_sends_requests_through_injected_http_client() -> None:
+    seen_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        return httpx.Response(200, text="<osm><note><id>42</id></note></osm>")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        osm_client = OSMAPIClient("token-123", http)
+        note_id = await osm_client.create_note(lat=40.5, lon=-111.9, text="Closed")
+
+    assert note_id == 42
+    assert len(seen_requests) == 1
+    assert str(seen_requests[0].url) == f"{OSM_API_BASE}/notes"
+    assert seen_requests[0].headers["Authorization"] == "Bearer token-123"
@@ -0,0 +1,187 @@
+import math
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import POINearbyRequest
+from app.routers.places import (
+    DISTANCE_KEY_TYPES,
+    decode_cursor,
+    encode_cursor,
+    make_geog_point,
+    make_point,
+    poi_response,
+    radius_envelope,
+)
+
+
+def _envelope_bounds(lon: float, lat: float, radius: float) -> list[float]:
+    envelope = radius_envelope(lon, lat, radius)
+    return [clause.value for clause in envelope.clauses][:4]
+
+
+def test_radius_envelope_widens_longitude_away_from_equator() -> None:
+    west, south, east, north = _envelope_bounds(10.0, 60.0, 1000)
+
+    # One degree of longitude at 60N is roughly half of its equatorial length,
+    # so the box must be about twice as wide as it is tall.
+    assert east - 10.0 > 1000 / (111_320 * math.cos(math.radians(60)))
+    assert east - 10.0 > (north - 60.0) * 1.9
+    assert 10.0 - west == east - 10.0
+    assert 60.0 - south == north - 60.0
+
+
+@pytest.mark.parametrize(
+    "lon, lat, radius",
+    [(0.0, 89.99, 10_000), (10.0, 89.99, 10_000), (179.99, 0.0, 5_000)],
+)
+def test_radius_envelope_clamps_near_poles(lon, lat, radius) -> None:
+    west, south, east, north = _envelope_bounds(lon, lat, radius)
+
+    # A box that would wrap past +-180 must not drop the POIs on the other side
+    assert (west, east) == (-180.0, 180.0)
+    assert south < lat < north
+
+
+@pytest.mark.parametrize(
+    "build, first, second",
+    [
+        (make_point, (10.0, 60.0), (-71.1, 42.3)),
+        (make_geog_point, (10.0, 60.0), (-71.1, 42.3)),
+        (radius_envelope, (10.0, 60.0, 100), (-71.1, 42.3, 5000)),
+    ],
+)
+def test_query_builders_share_compiled_cache_key(build, first, second) -> None:
+    # Coordinates must be bound parameters, otherwise every request compiles
+    # its own SQL string and misses the engine's compiled-statement cache.
+    assert build(*first)._generate_cache_key() == build(*second)._generate_cache_key()
+
+
+def test_cursor_round_trips_sort_key() -> None:
+    cursor = encode_cursor(152.3, "N", 123456789)
+
+    assert decode_cursor(cursor, DISTANCE_KEY_TYPES) == [152.3, "N", 123456789]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        encode_cursor("152.3", "N", 1),
+        encode_cursor(152.3, "N"),
+        encode_cursor(True, "N", 1),
+    ],
+)
+def test_decode_cursor_rejects_malformed_cursors(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, DISTANCE_KEY_TYPES)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_poi_response_maps_row_without_validation() -> None:
+    row = SimpleNamespace(
+        osm_id=42,
+        osm_type="W",
+        name="Cafe",
+        poi_class="cafe",
+        lat=52.1,
+        lon=5.1,
+        tags=None,
+        version=3,
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        distance=Decimal("12.5"),
+    )
+
+    poi = poi_response(row, is_checked_in=True)
+
+    assert poi.model_dump(by_alias=True, include={"osm_type", "poi_class", "tags"}) == {
+        "osm_type": "way",
+        "class": "cafe",
+        "tags": {},
+    }
+    assert poi.distance == 12.5
+    assert poi.is_checked_in is True
+
+
+def test_poi_response_keeps_missing_coordinates() -> None:
+    row = SimpleNamespace(
+        osm_id=42,
+        osm_type="N",
+        name="Cafe",
+        poi_class="cafe",
+        lat=None,
+        lon=None,
+        tags={},
+        version=1,
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        distance=None,
+    )
+
+    poi = poi_response(row, is_checked_in=False)
+
+    assert (poi.lat, poi.lon, poi.distance) == (None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_get_classes_reuses_cached_counts() -> None:
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.routers import places
+
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(all=MagicMock(return_value=[("cafe", 3)]))
+    places._classes_cache.clear()
+
+    try:
+        first = await places.get_classes(db=db, current_user=MagicMock())
+        second = await places.get_classes(db=db, current_user=MagicMock())
+    finally:
+        places._classes_cache.clear()
+
+    assert first.data == second.data == [{"class": "cafe", "count": 3}]
+    db.execute.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), ("cafe", ["cafe"]), (["cafe", "bar"], ["cafe", "bar"]), ([], None)],
+)
+def test_class_filter_accepts_single_class_or_list(value, expected) -> None:
+    request = POINearbyRequest(lat=0, lon=0, **{"class": value})
+
+    assert request.poi_class == expected
+
+
+@pytest.mark.parametrize("first_key", [152.3, "cafe"])
+def test_paginate_binds_cursor_ids_as_bigint(first_key) -> None:
+    from sqlalchemy import BigInteger, Numeric, cast, func, select
+    from sqlalchemy.dialects.postgresql import asyncpg
+
+    from app.db import poi_searchable
+    from app.routers.places import paginate
+
+    S = poi_searchable.c
+    if isinstance(first_key, float):
+        first = func.round(cast(func.ST_X(S.geom), Numeric), 1)
+        key_types = DISTANCE_KEY_TYPES
+    else:
+        first = func.lower(func.coalesce(S.name, ""))
+        key_types = (str, str, int)
+    osm_id = 2**31 + 12345  # Most node ids no longer fit in int4
+    query = paginate(
+        select(S.osm_id),
+        (first, S.osm_type, S.osm_id),
+        key_types,
+        encode_cursor(first_key, "N", osm_id),
+        0,
+        20,
+    )
+
+    compiled = query.compile(dialect=asyncpg.dialect())
+    binds = [b for b in compiled.binds.values() if b.value == osm_id]
+    assert binds and all(isinstance(b.type, BigInteger) for b in binds)
+    assert "::BIGINT" in str(compiled)
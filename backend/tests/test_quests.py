@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import QuestRespondRequest
+from app.routers.quests import respond_to_quest
+
+
+@pytest.mark.asyncio
+async def test_respond_to_quest_conflict_skips_osm_edit() -> None:
+    poi = SimpleNamespace(
+        osm_id=42,
+        osm_type="N",
+        name="Cafe",
+        poi_class="cafe",
+        lat=52.1,
+        lon=5.1,
+        tags={"amenity": "cafe"},
+        version=3,
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+    db = MagicMock()
+    # POI lookup finds the POI; the claiming insert hits the unique constraint
+    db.execute.side_effect = [
+        MagicMock(scalar_one_or_none=MagicMock(return_value=poi)),
+        MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
+    ]
+    request = QuestRespondRequest(
+        poi_osm_type="node",
+        poi_osm_id=42,
+        quest_id="wheelchair-accessible",
+        answer="yes",
+    )
+
+    with patch("app.routers.quests.OSMAPIClient") as osm_client:
+        with pytest.raises(HTTPException) as exc_info:
+            await respond_to_quest(
+                request=request,
+                db=db,
+                current_user=MagicMock(),
+                http_client=MagicMock(),
+            )
+
+    assert exc_info.value.status_code == 409
+    osm_client.assert_not_called()
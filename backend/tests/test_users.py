@@ -1,27 +1,73 @@
 from types import SimpleNamespace
-from unittest.mock import MagicMock, call
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.db import CheckIn
+from app.db import User
 from app.routers.users import delete_account
 
 
 @pytest.mark.asyncio
 async def test_delete_account_only_removes_user_owned_records() -> None:
-    db = MagicMock()
-    checkins_query = MagicMock()
-    checkins_filter = MagicMock()
-    current_user = SimpleNamespace(id=123)
-
-    db.query.return_value = checkins_query
-    checkins_query.filter.return_value = checkins_filter
+    db = AsyncMock()
+    current_user = SimpleNamespace(id=123, osm_user_id="456")
 
     response = await delete_account(db=db, current_user=current_user)
 
     assert response.success is True
-    assert db.query.call_args_list == [call(CheckIn)]
-    checkins_query.filter.assert_called_once()
-    checkins_filter.delete.assert_called_once_with()
-    db.delete.assert_called_once_with(current_user)
-    db.commit.assert_called_once_with()
+    db.execute.assert_awaited_once()
+    statement = db.execute.await_args.args[0]
+    # One DELETE on users; check-ins cascade in the database and the global
+    # quest_responses table is left alone
+    assert statement.table.name == User.__tablename__
+    assert statement.compile().params == {"id_1": 123}
+    db.commit.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_update_user_settings_returns_row_from_single_update() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    from app.models import UserSettingsUpdate
+    from app.routers.users import update_user_settings
+
+    db = AsyncMock()
+    stored = SimpleNamespace(id=123, osm_user_id="456")
+    db.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=stored))
+    current_user = SimpleNamespace(
+        id=123, osm_user_id="456", settings={"theme": "dark"}
+    )
+
+    user = await update_user_settings(
+        settings_update=UserSettingsUpdate(expert=True),
+        db=db,
+        current_user=current_user,
+    )
+
+    assert user is stored
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE users SET") and "RETURNING" in sql
+    # Only the provided key is sent and merged into the stored settings
+    assert "||" in sql
+    params = db.execute.await_args.args[0].compile().params
+    assert {"expert": True} in params.values()
+    assert {"theme": "dark", "expert": True} not in params.values()
+    db.refresh.assert_not_awaited()
+    db.commit.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_update_user_settings_without_changes_skips_database() -> None:
+    from app.models import UserSettingsUpdate
+    from app.routers.users import update_user_settings
+
+    db = AsyncMock()
+    current_user = SimpleNamespace(id=123, osm_user_id="456", settings={})
+
+    user = await update_user_settings(
+        settings_update=UserSettingsUpdate(), db=db, current_user=current_user
+    )
+
+    assert user is current_user
+    db.execute.assert_not_awaited()
+    db.commit.assert_not_awaited()
@@ -0,0 +1,51 @@
+-- poi_searchable: read model behind the nearby/bbox/search endpoints
+--
+-- Holds the POIs the list endpoints may return (bus stops excluded) with the
+-- geography cast precomputed, so queries neither re-check the highway tag nor
+-- cast geom per row. Safe to run repeatedly; run_osm2pgsql.sh applies it after
+-- each import and update_osm2pgsql.sh refreshes it after each update.
+
+-- pg_trgm backs the substring (ILIKE '%q%') indexes of the search endpoint
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS poi_searchable AS
+SELECT
+    osm_type,
+    osm_id,
+    name,
+    class,
+    tags,
+    geom,
+    geom::geography AS geog,
+    version,
+    timestamp
+FROM pois
+WHERE (tags->>'highway') IS DISTINCT FROM 'bus_stop';
+
+-- Unique key is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS poi_searchable_pkey
+    ON poi_searchable (osm_type, osm_id);
+-- GiST serves the KNN (<->) ordering of nearby/search; PostGIS SP-GiST has
+-- no distance ordering support for geometry, so it cannot replace it.
+CREATE INDEX IF NOT EXISTS poi_searchable_geom_gix
+    ON poi_searchable USING gist (geom);
+-- SP-GiST is smaller and faster for the pure containment tests of the bbox
+-- endpoint (ST_Within / &&) on point data.
+CREATE INDEX IF NOT EXISTS poi_searchable_geom_spgix
+    ON poi_searchable USING spgist (geom);
+CREATE INDEX IF NOT EXISTS poi_searchable_geog_gix
+    ON poi_searchable USING gist (geog);
+CREATE INDEX IF NOT EXISTS poi_searchable_class_idx
+    ON poi_searchable (class);
+-- Trigram GIN indexes let search's leading-wildcard ILIKE filters use bitmap
+-- index scans instead of scanning the whole view
+CREATE INDEX IF NOT EXISTS poi_searchable_name_trgm
+    ON poi_searchable USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS poi_searchable_tag_name_trgm
+    ON poi_searchable USING gin ((tags->>'name') gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS poi_searchable_tag_name_en_trgm
+    ON poi_searchable USING gin ((tags->>'name:en') gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS poi_searchable_tag_brand_trgm
+    ON poi_searchable USING gin ((tags->>'brand') gin_trgm_ops);
+
+ANALYZE poi_searchable;
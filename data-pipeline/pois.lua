@@ -37,6 +37,38 @@ for _, candidates in pairs(poi_lookup) do
     end)
 end
 
+-- Split each key's sorted candidates by the value of their first pair, so a
+-- tag only checks the rules that can match it. Wildcard rules are appended to
+-- every value list in their sorted position and also kept for values that no
+-- exact rule mentions.
+local value_lookup = {}
+local wildcard_lookup = {}
+for key, candidates in pairs(poi_lookup) do
+    local by_value = {}
+    local wildcards = {}
+    for _, candidate in ipairs(candidates) do
+        local expected = candidate.match[1][2]
+        if expected ~= '*' and not by_value[expected] then
+            by_value[expected] = {}
+        end
+    end
+    for _, candidate in ipairs(candidates) do
+        local expected = candidate.match[1][2]
+        if expected == '*' then
+            table.insert(wildcards, candidate)
+            for _, list in pairs(by_value) do
+                table.insert(list, candidate)
+            end
+        else
+            table.insert(by_value[expected], candidate)
+        end
+    end
+    value_lookup[key] = by_value
+    if #wildcards > 0 then
+        wildcard_lookup[key] = wildcards
+    end
+end
+
 local function matches_rule(tags, rule)
     for _, pair in ipairs(rule) do
         local key = pair[1]
@@ -75,10 +107,14 @@ end
 -- Function to find POI category from mapping
 function find_poi_category(object)
     for key, value in pairs(object.tags) do
-        if poi_lookup[key] then
-            for _, candidate in ipairs(poi_lookup[key]) do
-                if matches_rule(object.tags, candidate.match) then
-                    return { class = candidate.class }
+        local by_value = value_lookup[key]
+        if by_value then
+            local candidates = by_value[value] or wildcard_lookup[key]
+            if candidates then
+                for _, candidate in ipairs(candidates) do
+                    if matches_rule(object.tags, candidate.match) then
+                        return { class = candidate.class }
+                    end
                 end
             end
         end
@@ -92,28 +128,27 @@ function process_poi(object)
     if not object.tags.name then
         return {}
     end
-    local fields = {
-        name = object:grab_tag('name'),
-        tags = object.tags,
-        version = object.version,
-        timestamp = format_date(object.timestamp),
-    }
 
     -- Try to find category using the mapping
+    local class
     local category = find_poi_category(object)
     if category then
         -- Store the POI category name as the class
-        fields.class = category.class
-        return fields
-    end
-
-    -- Fallback: mark as miscellaneous if it still looks like a POI
-    if object.tags.amenity or object.tags.shop or object.tags.leisure or object.tags.tourism then
-        fields.class = 'misc'
-        return fields
+        class = category.class
+    elseif object.tags.amenity or object.tags.shop or object.tags.leisure or object.tags.tourism then
+        -- Fallback: mark as miscellaneous if it still looks like a POI
+        class = 'misc'
+    else
+        return {}
     end
 
-    return {}
+    return {
+        name = object:grab_tag('name'),
+        class = class,
+        tags = object.tags,
+        version = object.version,
+        timestamp = format_date(object.timestamp),
+    }
 end
 
 -- Node processing
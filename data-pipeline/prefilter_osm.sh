@@ -2,7 +2,7 @@
 
 # OSM Pre-filtering Script
 # Uses osmium-tool to pre-filter planet OSM data for faster osm2pgsql processing
-# Only extracts nodes/ways with name tags and POI-related tags
+# Only extracts nodes/ways with tags that pois.lua can import as POIs
 
 set -e
 
@@ -11,6 +11,8 @@ DATA_DIR=${DATA_DIR:-"../data"}
 INPUT_FILE=${INPUT_FILE:-"$DATA_DIR/planet-latest.osm.pbf"}
 OUTPUT_FILE=${OUTPUT_FILE:-"$DATA_DIR/planet-pois-filtered.osm.pbf"}
 DOWNLOAD_URL=${DOWNLOAD_URL:-"https://planet.openstreetmap.org/pbf/planet-latest.osm.pbf"}
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+FILTER_FILE=${FILTER_FILE:-"$SCRIPT_DIR/poi_filters.txt"}
 
 # Color output
 RED='\033[0;31m'
@@ -36,6 +38,12 @@ fi
 echo -e "${GREEN}✅ osmium-tool found: $(osmium --version | head -n1)${NC}"
 echo ""
 
+if [ ! -f "$FILTER_FILE" ]; then
+    echo -e "${RED}❌ Error: filter expressions not found at $FILTER_FILE${NC}"
+    echo "Generate them with: make generate-mappings"
+    exit 1
+fi
+
 # Create data directory if needed
 mkdir -p "$DATA_DIR"
 
@@ -70,32 +78,22 @@ echo "   Size: $INPUT_SIZE"
 echo ""
 
 # Run osmium tags-filter
-# Filter for nodes and ways that have:
-# - A name tag (required)
-# - At least one of: amenity, shop, leisure, tourism, office, craft
+# Keep nodes and ways carrying a tag that pois.lua can turn into a POI. The
+# expressions are generated from category_mapping.json; the name check is
+# left to pois.lua because osmium ORs all expressions together.
 echo -e "${BLUE}🔍 Running osmium tags-filter...${NC}"
-echo "   Filtering for POIs with name tags"
+echo "   Filtering for POI tags in $FILTER_FILE"
 echo "   Output: $OUTPUT_FILE"
 echo ""
 
 START_TIME=$(date +%s)
 
-# The filter expression:
-# - n,w = nodes and ways only (no relations)
-# - name= means "must have a name tag"
-# - amenity,shop,leisure,tourism,office,craft = must have at least one POI tag
 osmium tags-filter \
     "$INPUT_FILE" \
     --overwrite \
     --progress \
-    -o "$OUTPUT_FILE" \
-    nw/name= \
-    nw/amenity \
-    nw/shop \
-    nw/leisure \
-    nw/tourism \
-    nw/office \
-    nw/craft
+    --expressions "$FILTER_FILE" \
+    -o "$OUTPUT_FILE"
 
 END_TIME=$(date +%s)
 DURATION=$((END_TIME - START_TIME))
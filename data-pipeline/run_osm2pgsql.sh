@@ -12,7 +12,10 @@ DATABASE_PASSWORD=${DATABASE_PASSWORD:-fourmore_dev_password}
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 LUA_SCRIPT=${LUA_SCRIPT:-"$SCRIPT_DIR/pois.lua"}
+SEARCHABLE_SQL=${SEARCHABLE_SQL:-"$SCRIPT_DIR/poi_searchable.sql"}
 OSM_DATA_FILE=${OSM_DATA_FILE:-"/app/data/planet-pois-filtered.osm.pbf"}
+# Parallel processes osm2pgsql uses for the pending ways and index building
+OSM2PGSQL_PROCESSES=${OSM2PGSQL_PROCESSES:-$(nproc 2>/dev/null || echo 1)}
 
 # Check if required files exist
 if [ ! -f "$LUA_SCRIPT" ]; then
@@ -29,17 +32,27 @@ echo "Starting osm2pgsql data load..."
 echo "Database: $DATABASE_NAME on $DATABASE_HOST:$DATABASE_PORT"
 echo "Lua script: $LUA_SCRIPT"
 echo "OSM data: $OSM_DATA_FILE"
+echo "Processes: $OSM2PGSQL_PROCESSES"
 
 # Set PGPASSWORD for authentication
 export PGPASSWORD="$DATABASE_PASSWORD"
 
-osm2pgsql \
+PSQL="psql -v ON_ERROR_STOP=1 -d $DATABASE_NAME -h $DATABASE_HOST -p $DATABASE_PORT -U $DATABASE_USER"
+
+# The view depends on the pois table, which --create drops and recreates
+$PSQL -c "DROP MATERIALIZED VIEW IF EXISTS poi_searchable"
+
+# A failed import is simply rerun from scratch, so the load can skip waiting
+# for WAL flushes on commit. PGOPTIONS is applied to every libpq connection
+# osm2pgsql opens, and only for this command.
+PGOPTIONS="${PGOPTIONS:+$PGOPTIONS }-c synchronous_commit=off" osm2pgsql \
     --slim \
     --database "$DATABASE_NAME" \
     --host "$DATABASE_HOST" \
     --port "$DATABASE_PORT" \
     --user "$DATABASE_USER" \
     --create \
+    --number-processes "$OSM2PGSQL_PROCESSES" \
     --output flex \
     --style "$LUA_SCRIPT" \
     "$OSM_DATA_FILE"
@@ -48,6 +61,9 @@ exit_code=$?
 
 if [ $exit_code -eq 0 ]; then
     echo "osm2pgsql completed successfully"
+    echo "Building poi_searchable view..."
+    $PSQL -f "$SEARCHABLE_SQL"
+    exit_code=$?
 else
     echo "osm2pgsql failed with exit code $exit_code"
 fi
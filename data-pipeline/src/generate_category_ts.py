@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 REPO_ROOT = ROOT.parent
@@ -22,32 +23,34 @@ from fourmore_shared.category_mapping import (
     unique_icon_names,
 )
 
+_TS_ESCAPES = str.maketrans({"\\": "\\\\", "'": "\\'", "\n": "\\n"})
+
 
 def ts_string_literal(value: str) -> str:
     """Escape a string for TypeScript string literal."""
-    escaped = value.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
-    return f"'{escaped}'"
-
+    return f"'{value.translate(_TS_ESCAPES)}'"
 
-def generate_category_type(categories: List[Dict[str, Any]]) -> str:
-    """Generate the CategoryKey union type."""
-    category_keys = [ts_string_literal(cat["class"]) for cat in categories]
-    return f"export type CategoryKey = {' | '.join(category_keys)}"
 
+def generate_category_declarations(
+    categories: List[Dict[str, Any]],
+) -> Tuple[str, str]:
+    """Generate the CategoryKey union type and the CATEGORY_META object.
 
-def generate_category_meta_object(categories: List[Dict[str, Any]]) -> str:
-    """Generate the CATEGORY_META object."""
-    lines = ["export const CATEGORY_META = {"]
+    Both are built in a single pass over the categories.
+    """
+    category_keys = []
+    meta_lines = ["export const CATEGORY_META = {"]
 
     for category in categories:
         class_name = category["class"]
+        category_keys.append(ts_string_literal(class_name))
         label = ts_string_literal(category["label"])
         icon = category["icon"]
+        meta_lines.append(f"  {class_name}: {{ label: {label}, Icon: {icon} }},")
 
-        lines.append(f"  {class_name}: {{ label: {label}, Icon: {icon} }},")
-
-    lines.append("} as const")
-    return "\n".join(lines)
+    meta_lines.append("} as const")
+    category_type = f"export type CategoryKey = {' | '.join(category_keys)}"
+    return category_type, "\n".join(meta_lines)
 
 
 def generate_typescript_file(categories: List[Dict[str, Any]]) -> str:
@@ -59,6 +62,7 @@ def generate_typescript_file(categories: List[Dict[str, Any]]) -> str:
     icons = unique_icon_names(categories)
     ordered_icons = [fallback_icon] + [icon for icon in icons if icon != fallback_icon]
     icon_imports = ",\n  ".join(ordered_icons)
+    category_type, category_meta = generate_category_declarations(categories)
 
     content = f"""// This file is auto-generated from category_mapping.json
 // Do not edit by hand. Update category_mapping.json and run generate_category_ts.py
@@ -68,14 +72,14 @@ import {{
   {icon_imports},
 }} from '@tabler/icons-react'
 
-type IconProps = Partial<ComponentProps<typeof {ordered_icons[0]}>>
-type IconComponent = typeof {ordered_icons[0]}
+type IconProps = Partial<ComponentProps<typeof {fallback_icon}>>
+type IconComponent = typeof {fallback_icon}
 
-{generate_category_type(categories)}
+{category_type}
 
 type CategoryMeta = {{ label: string; Icon: IconComponent }}
 
-{generate_category_meta_object(categories)}
+{category_meta}
 
 const DEFAULT_META: CategoryMeta = {{ label: {ts_string_literal(fallback_label)}, Icon: {fallback_icon} }}
 
@@ -146,6 +150,25 @@ export const getCategoryLabel = (className: string | undefined) => {{
     return content
 
 
+def write_if_changed(path: Path, content: str) -> bool:
+    """Atomically replace path with content unless it already matches.
+
+    Writing a temp file and renaming it means a dev server watching the
+    output never reads a half-written file; skipping identical content
+    avoids triggering a rebuild at all.
+    """
+    try:
+        if path.read_text() == content:
+            return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+    return True
+
+
 def main() -> None:
     """Generate the TypeScript category metadata file."""
     print("Generating TypeScript category metadata...")
@@ -161,10 +184,10 @@ def main() -> None:
     # Generate TypeScript content
     ts_content = generate_typescript_file(categories)
 
-    # Write to file
-    OUTPUT_FILE.write_text(ts_content)
-
-    print(f"Generated {OUTPUT_FILE}")
+    if write_if_changed(OUTPUT_FILE, ts_content):
+        print(f"Generated {OUTPUT_FILE}")
+    else:
+        print(f"{OUTPUT_FILE} is up to date")
     print(f"Categories: {len(categories)}")
 
 
@@ -3,13 +3,18 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
-from typing import Iterable, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 REPO_ROOT = ROOT.parent
 OUTPUT_FILE = ROOT / "poi_mapping.lua"
+FILTER_FILE = ROOT / "poi_filters.txt"
+WRITE_BUFFER_SIZE = 1024 * 1024
+# Keys pois.lua imports with any value (as class 'misc') when no rule matches
+FALLBACK_KEYS = ("amenity", "shop", "leisure", "tourism")
 
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
@@ -45,26 +50,69 @@ def render_entry(entry: dict) -> Iterable[str]:
     yield "    },"
 
 
+def filter_expressions(categories: Sequence[dict]) -> List[str]:
+    """Build osmium tags-filter expressions for everything pois.lua can import.
+
+    Each rule is keyed by its first tag, so keeping objects that have the
+    first tag of some rule (or a fallback key) drops nothing pois.lua would
+    keep, while objects like office=yes never reach osm2pgsql.
+    """
+    values: Dict[str, Optional[Set[str]]] = {key: None for key in FALLBACK_KEYS}
+    for entry in categories:
+        for match in entry.get("matches", []):
+            key, value = normalize_match(match)[0]
+            if value == "*":
+                values[key] = None
+            elif key not in values:
+                values[key] = {value}
+            elif values[key] is not None:
+                values[key].add(value)
+
+    expressions = []
+    for key in sorted(values):
+        if values[key] is None:
+            expressions.append(f"nw/{key}")
+        else:
+            expressions.append(f"nw/{key}={','.join(sorted(values[key]))}")
+    return expressions
+
+
+def write_filter_file(categories: Sequence[dict]) -> None:
+    content = "\n".join(
+        [
+            "# osmium tags-filter expressions generated from category_mapping.json",
+            "# Do not edit by hand. Update category_mapping.json and rerun generate_poi_mapping.py",
+            *filter_expressions(categories),
+        ]
+    )
+    tmp_path = FILTER_FILE.with_name(FILTER_FILE.name + ".tmp")
+    tmp_path.write_text(content + "\n")
+    os.replace(tmp_path, FILTER_FILE)
+
+
 def main() -> None:
     try:
         categories = load_category_mapping()
     except CategoryMappingError as error:
         raise SystemExit(f"[generate_poi_mapping] {error}") from error
 
-    lines = [
-        "-- POI category mapping generated from category_mapping.json",
-        "-- Do not edit by hand. Update category_mapping.json and rerun generate_poi_mapping.py",
-        "local poi_mapping = {",
-    ]
-
-    for entry in categories:
-        lines.extend(render_entry(entry))
-
-    lines.append("}")
-    lines.append("")
-    lines.append("return poi_mapping")
-
-    OUTPUT_FILE.write_text("\n".join(lines) + "\n")
+    # Stream the entries into a temp file and rename it into place, so
+    # osm2pgsql never picks up a half-written mapping.
+    tmp_path = OUTPUT_FILE.with_name(OUTPUT_FILE.name + ".tmp")
+    with tmp_path.open("w", buffering=WRITE_BUFFER_SIZE) as output:
+        output.write(
+            "-- POI category mapping generated from category_mapping.json\n"
+            "-- Do not edit by hand. Update category_mapping.json and rerun generate_poi_mapping.py\n"
+            "local poi_mapping = {\n"
+        )
+        for entry in categories:
+            for line in render_entry(entry):
+                output.write(line)
+                output.write("\n")
+        output.write("}\n\nreturn poi_mapping\n")
+    os.replace(tmp_path, OUTPUT_FILE)
+
+    write_filter_file(categories)
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ DATABASE_PASSWORD=${DATABASE_PASSWORD:-fourmore_dev_password}
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 LUA_SCRIPT=${LUA_SCRIPT:-"$SCRIPT_DIR/pois.lua"}
+SEARCHABLE_SQL=${SEARCHABLE_SQL:-"$SCRIPT_DIR/poi_searchable.sql"}
 OSM_DATA_FILE=${OSM_DATA_FILE:-"/app/data/planet-pois-filtered.osm.pbf"}
 
 # Check if Lua script exists
@@ -76,6 +77,13 @@ echo ""
 if [ $exit_code -eq 0 ]; then
     echo "✓ osm2pgsql update completed successfully"
     echo ""
+    echo "Refreshing poi_searchable view..."
+    PSQL="psql -v ON_ERROR_STOP=1 -d $DATABASE_NAME -h $DATABASE_HOST -p $DATABASE_PORT -U $DATABASE_USER"
+    # Creates the view on databases imported before it existed; a no-op otherwise
+    $PSQL -f "$SEARCHABLE_SQL" && \
+        $PSQL -c "REFRESH MATERIALIZED VIEW CONCURRENTLY poi_searchable"
+    exit_code=$?
+    echo ""
     echo "Updated replication status:"
     osm2pgsql-replication status $DB_CONN
 else
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import (
     Any,
@@ -131,8 +133,24 @@ def validate_category_mapping(categories: Any) -> None:
 
 
 def load_category_mapping(path: Union[str, Path, None] = None) -> List[Dict[str, Any]]:
-    """Load and validate the category mapping JSON."""
+    """Load and validate the category mapping JSON.
+
+    The parsed mapping is cached per file and modification time, so repeated
+    calls (one per categories API request) skip the read and validation until
+    the file changes. Callers share the returned list and must not mutate it.
+    """
     target_path = Path(path) if path else DEFAULT_MAPPING_PATH
+    try:
+        mtime_ns = target_path.stat().st_mtime_ns
+    except FileNotFoundError as exc:
+        raise CategoryMappingError(
+            f"Category mapping file not found: {target_path}"
+        ) from exc
+    return _load_category_mapping(target_path.resolve(), mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_category_mapping(target_path: Path, mtime_ns: int) -> List[Dict[str, Any]]:
     try:
         categories = json.loads(target_path.read_text())
     except FileNotFoundError as exc:
@@ -150,21 +168,23 @@ def load_category_mapping(path: Union[str, Path, None] = None) -> List[Dict[str,
 
 def unique_icon_names(categories: Sequence[Mapping[str, Any]]) -> List[str]:
     """Return sorted unique icon component names used across categories."""
-    icons = {str(category["icon"]) for category in categories}
-    return sorted(icons)
+    # Icons are validated as non-empty strings when the mapping is loaded
+    return sorted(set(map(itemgetter("icon"), categories)))
 
 
 def resolve_fallback_category(
     categories: Sequence[Mapping[str, Any]],
 ) -> Mapping[str, Any]:
     """Return the single fallback category defined in the mapping."""
-    fallback_candidates = [
-        category for category in categories if category.get("is_fallback")
-    ]
-    if not fallback_candidates:
+    fallback = None
+    for category in categories:
+        if not category.get("is_fallback"):
+            continue
+        if fallback is not None:
+            raise CategoryMappingError(
+                "Multiple categories marked with is_fallback=true; expected exactly one"
+            )
+        fallback = category
+    if fallback is None:
         raise CategoryMappingError("No fallback category marked with is_fallback=true")
-    if len(fallback_candidates) > 1:
-        raise CategoryMappingError(
-            "Multiple categories marked with is_fallback=true; expected exactly one"
-        )
-    return fallback_candidates[0]
+    return fallback
@@ -20,7 +20,7 @@ echo "Validating category_mapping.json..."
 "$PYTHON_BIN" src/validate_category_mapping.py
 
 # Generate Lua mapping for osm2pgsql
-echo "Generating poi_mapping.lua..."
+echo "Generating poi_mapping.lua and poi_filters.txt..."
 "$PYTHON_BIN" src/generate_poi_mapping.py
 
 # Generate TypeScript metadata for frontend
@@ -31,6 +31,7 @@ echo "All mapping files generated successfully!"
 echo ""
 echo "Generated files:"
 echo "  - data-pipeline/poi_mapping.lua (for osm2pgsql)"
+echo "  - data-pipeline/poi_filters.txt (for prefilter_osm.sh)"
 echo "  - frontend/src/generated/category_metadata.tsx (for frontend)"
 echo ""
 echo "Remember to rebuild your frontend and data pipeline after changes to category_mapping.json"
@@ -39,6 +39,8 @@ psql -h "$DB_HOST" -p "$DB_PORT" -U "$DB_USER" -d "$DB_NAME" << 'EOF'
 -- Enable PostGIS extension
 CREATE EXTENSION IF NOT EXISTS postgis;
 CREATE EXTENSION IF NOT EXISTS postgis_topology;
+-- Trigram indexes for substring search on POI names
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- Create indexes that will be useful for OSM data
 -- These will be created by osm2pgsql, but ensuring they exist
@@ -1,6 +1,8 @@
 -- Enable PostGIS extension
 CREATE EXTENSION IF NOT EXISTS postgis;
 CREATE EXTENSION IF NOT EXISTS postgis_topology;
+-- Trigram indexes for substring search on POI names
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- Create database and user if they don't exist
 -- (This is handled by the Docker environment variables, but keeping for reference)
\ No newline at end of file